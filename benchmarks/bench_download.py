@@ -0,0 +1,96 @@
+"""CPU time to download a large document: an iter_content() loop vs download_many() into a memory-mapped file.
+
+The async client's download_many() is timed too; httpx yields bytes chunks, which it copies into the mapping.
+
+Serves a random body from a local HTTP server, so the numbers reflect client overhead rather than the network.
+
+Run with: python benchmarks/bench_download.py [--size-mb 200] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from accela import AccelaClient, AsyncAccelaClient, Document  # noqa: E402
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.thread_time()
+        fn()
+        timings.append(time.thread_time() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=200, help="document size in MiB")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = os.urandom(args.size_mb * 1024 * 1024)
+    server = serve(body)
+    client = AccelaClient("token", agency="AGENCY", environment="PROD")
+    client.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}/v4"
+    document = Document(id=1, file_name="plans.pdf", size=len(body))
+
+    with tempfile.TemporaryDirectory() as directory:
+        def iter_content():
+            response = client.documents.download(document.id)
+            with open(os.path.join(directory, "iter_content.pdf"), "wb") as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    f.write(chunk)
+
+        def mapped():
+            client.documents.download_many([document], directory)
+            os.unlink(os.path.join(directory, "1-plans.pdf"))
+
+        async def download_async():
+            async with AsyncAccelaClient("token", agency="AGENCY", environment="PROD") as async_client:
+                async_client.BASE_URL = client.BASE_URL
+                await async_client.documents.download_many([document], directory)
+
+        def mapped_async():
+            asyncio.run(download_async())
+            os.unlink(os.path.join(directory, "1-plans.pdf"))
+
+        print(f"{args.size_mb:,} MiB document, CPU time of the downloading thread, best of {args.repeat}")
+        baseline = best_of(args.repeat, iter_content)
+        print(f"iter_content(8192)  {baseline:>6.2f}s")
+        elapsed = best_of(args.repeat, mapped)
+        print(f"download_many mmap  {elapsed:>6.2f}s ({baseline / elapsed:.1f}x)")
+        elapsed = best_of(args.repeat, mapped_async)
+        print(f"async download_many {elapsed:>6.2f}s ({baseline / elapsed:.1f}x)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
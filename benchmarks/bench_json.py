@@ -0,0 +1,80 @@
+"""Parse and serialize throughput of each installed JSON codec on list-page bodies of Record payloads.
+
+Also times the item-by-item parser used with stream_json=True, which decodes with the stdlib whatever the codec.
+
+Run with: python benchmarks/bench_json.py [--count 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from accela.resources.records import Record  # noqa: E402
+from accela.util.json_codec import CODECS  # noqa: E402
+from accela.util.json_stream import JSONArrayStream  # noqa: E402
+from payloads import record_payloads  # noqa: E402
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def stream(body: bytes, chunk_size: int = 64 * 1024) -> list:
+    parser = JSONArrayStream()
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items += parser.feed(body[start:start + chunk_size])
+    return items + parser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000, help="records per page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = record_payloads(args.count)
+    body = json.dumps({"result": payloads, "page": {"offset": 0, "limit": args.count}, "status": 200}).encode()
+    dicts = [Record.from_json(payload).to_dict() for payload in payloads]
+    expected = json.loads(body)
+
+    print(f"{args.count:,} records per page, {len(body) / 1024 / 1024:.1f} MiB body, best of {args.repeat}")
+    results = {}
+    for name, codec_class in CODECS.items():
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+
+        # Every codec must round-trip to the same values as the stdlib
+        assert codec.loads(body) == expected, name
+        assert json.loads(codec.dumps(dicts)) == json.loads(json.dumps(dicts, default=str)), name
+
+        loads = best_of(args.repeat, lambda: codec.loads(body))
+        dumps = best_of(args.repeat, lambda: codec.dumps(dicts))
+        results[name] = (loads, dumps)
+
+    assert stream(body) == expected["result"]
+    streamed = best_of(args.repeat, lambda: stream(body))
+
+    stdlib_loads, stdlib_dumps = results["json"]
+    for name, (loads, dumps) in results.items():
+        print(
+            f"{name:<8} loads {len(body) / loads / 1024 / 1024:>8,.0f} MiB/s ({stdlib_loads / loads:>4.1f}x)"
+            f"  dumps {args.count / dumps:>10,.0f} records/s ({stdlib_dumps / dumps:>4.1f}x)"
+        )
+    print(f"stream   loads {len(body) / streamed / 1024 / 1024:>8,.0f} MiB/s ({stdlib_loads / streamed:>4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Memory needed to hold decoded records in each model representation.
+
+Run with: python benchmarks/bench_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from accela.resources.records import Record  # noqa: E402
+from payloads import record_payload  # noqa: E402
+
+
+class _Client:
+    def __init__(self, compact_models=False, keep_raw_json=True):
+        self.timezone = None
+        self.lazy_models = False
+        self.compact_models = compact_models
+        self.keep_raw_json = keep_raw_json
+
+
+MODES = {
+    "dataclass + raw_json (default)": _Client(),
+    "dataclass, raw_json dropped": _Client(keep_raw_json=False),
+    "compact + raw_json": _Client(compact_models=True),
+    "compact, raw_json dropped": _Client(compact_models=True, keep_raw_json=False),
+}
+
+
+def measure(client, count):
+    gc.collect()
+    tracemalloc.start()
+    # Payloads are parsed one at a time, as from a response body, so a payload is only retained if the model keeps it
+    records = [Record.from_json(json.loads(json.dumps(record_payload(i))), client) for i in range(count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Holding {args.count:,} records")
+    baseline = None
+    for name, client in MODES.items():
+        used = measure(client, args.count)
+        baseline = baseline or used
+        print(f"{name:<32} {used / 1024 / 1024:>9,.1f} MiB  {used / args.count:>8,.0f} B/record  {used / baseline:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
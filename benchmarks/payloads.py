@@ -0,0 +1,128 @@
+"""Synthetic but realistically shaped Accela API payloads shared by the benchmarks."""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+
+def record_payload(i: int) -> Dict[str, Any]:
+    """A record as returned by GET /v4/records, with nested custom forms, tables and contacts."""
+    opened = datetime(2020, 1, 1) + timedelta(hours=7 * i)
+
+    def ts(offset_days: int) -> str:
+        return (opened + timedelta(days=offset_days)).strftime("%Y-%m-%d %H:%M:%S")
+
+    return {
+        "id": f"AGENCY-20CAP-{i:08d}",
+        "customId": f"BLD2020-{i:05d}",
+        "trackingId": 1000000 + i,
+        "serviceProviderCode": "AGENCY",
+        "name": f"New single family dwelling {i}",
+        "description": "Construct new two-story single family dwelling with attached garage and covered porch",
+        "module": "Building",
+        "recordClass": "COMPLETE",
+        "initiatedProduct": "AV360",
+        "createdBy": "PUBLICUSER123",
+        "assignedUser": "JSMITH",
+        "assignedToDepartment": "AGENCY/BLD/NA/NA/NA/NA/NA",
+        "openedDate": ts(0),
+        "assignedDate": ts(1),
+        "statusDate": ts(5),
+        "updateDate": ts(6),
+        "reportedDate": ts(0),
+        "estimatedDueDate": ts(30),
+        "completeDate": None,
+        "closedDate": None,
+        "balance": float(i % 500),
+        "totalFee": 1250.75 + i,
+        "totalPay": 1000.0,
+        "totalJobCost": 0.0,
+        "jobValue": 350000.0 + i,
+        "housingUnits": 1,
+        "numberOfBuildings": 1,
+        "booking": "N",
+        "infraction": "N",
+        "misdemeanor": "N",
+        "offenseWitnessed": "N",
+        "defendantSignature": "N",
+        "publicOwned": "N",
+        "status": {"value": "Issued", "text": "Issued"},
+        "statusType": "ACTIVE",
+        "priority": {"value": "Medium", "text": "Medium"},
+        "reportedChannel": {"value": "Internet", "text": "Internet"},
+        "type": {
+            "id": "Building-Residential-New-NA",
+            "group": "Building",
+            "type": "Residential",
+            "subType": "New",
+            "category": "NA",
+            "value": "Building/Residential/New/NA",
+            "text": "Residential New",
+            "alias": "Residential New",
+            "module": "Building",
+            "filterName": "",
+        },
+        "addresses": [
+            {
+                "id": 500000 + i,
+                "streetStart": 100 + i % 900,
+                "streetName": "Main",
+                "streetSuffix": {"value": "ST", "text": "ST"},
+                "city": "Springfield",
+                "state": {"value": "NC", "text": "NC"},
+                "postalCode": "28202",
+                "isPrimary": "Y",
+                "recordId": {"id": f"AGENCY-20CAP-{i:08d}", "customId": f"BLD2020-{i:05d}"},
+            }
+        ],
+        "parcel": [{"id": f"P{i}", "parcelNumber": f"{i:09d}", "isPrimary": "Y"}],
+        "contact": [
+            {
+                "id": f"C{i}",
+                "firstName": "Jane",
+                "lastName": "Doe",
+                "businessName": "Doe Builders LLC",
+                "email": "jane@example.com",
+                "phone1": "7045550100",
+                "type": {"value": "Applicant", "text": "Applicant"},
+                "isPrimary": "Y",
+                "address": {"addressLine1": "1 Elm St", "city": "Springfield", "postalCode": "28202"},
+            }
+        ],
+        "professional": [
+            {
+                "id": f"L{i}",
+                "licenseNumber": f"GC{i:06d}",
+                "licenseType": {"value": "General Contractor", "text": "General Contractor"},
+                "businessName": "Acme Construction",
+                "isPrimary": "Y",
+            }
+        ],
+        "customForms": [
+            {
+                "id": "BLD_RES-GENERAL.cINFO",
+                "heatedSquareFeet": str(1800 + i % 400),
+                "unheatedSquareFeet": "450",
+                "numberOfStories": "2",
+                "constructionTypeCode": "VB",
+                "occupancyGroup": "R-3",
+                "sprinklerSystem": "No",
+                "fireAlarmSystem": "No",
+                "estimatedStartDate": "2020-02-01",
+            }
+        ],
+        "customTables": [
+            {
+                "id": "BLD_RES-INSPECTIONS",
+                "rows": [
+                    {"id": str(j), "fields": {"inspectionType": "Footing", "inspectionResult": "Passed", "inspectorName": "Bob"}}
+                    for j in range(3)
+                ],
+            }
+        ],
+        "conditions": [],
+        "assets": [],
+    }
+
+
+def record_payloads(count: int) -> List[Dict[str, Any]]:
+    return [record_payload(i) for i in range(count)]
@@ -1,18 +1,43 @@
+from .async_client import AsyncAccelaClient
 from .client import AccelaClient
-from .resources.documents import Document
+from .export import Exporter, ExportResult
+from .resources.documents import Document, DownloadProgress, DownloadResult, DownloadSizeError
 from .resources.modules import Module
 from .resources.record_addresses import RecordAddress
 from .resources.record_types import RecordType
-from .resources.records import Record
-from .util.access_token import AccelaAccessToken, get_access_token
+from .resources.records import Record, RetrieveManyResult
+from .sync import RecordSync
+from .util.access_token import AccelaAccessToken, TokenProvider, get_access_token, refresh_access_token
+from .util.cache import ResponseCache
+from .util.document_store import DocumentStore
+from .util.http_cache import HTTPCache
+from .util.token_cache import FileTokenCache
+from .util.watermarks import FileWatermarkStore, SQLiteWatermarkStore, WatermarkStore
 
 __all__ = [
     "AccelaClient",
+    "AsyncAccelaClient",
     "Record",
+    "RetrieveManyResult",
     "RecordAddress",
     "Document",
+    "DownloadResult",
+    "DownloadProgress",
+    "DownloadSizeError",
     "Module",
     "RecordType",
     "AccelaAccessToken",
     "get_access_token",
+    "refresh_access_token",
+    "TokenProvider",
+    "FileTokenCache",
+    "RecordSync",
+    "Exporter",
+    "ExportResult",
+    "WatermarkStore",
+    "ResponseCache",
+    "HTTPCache",
+    "DocumentStore",
+    "FileWatermarkStore",
+    "SQLiteWatermarkStore",
 ]
@@ -0,0 +1,242 @@
+import asyncio
+import time
+from typing import Any, ClassVar, Dict, Optional, Type, Union
+from zoneinfo import ZoneInfo
+
+from .client import BaseAccelaClient, _Attempts
+from .resources.async_resources import (
+    AsyncAgencies,
+    AsyncAgencyEnvironments,
+    AsyncDocuments,
+    AsyncModules,
+    AsyncRecordAddresses,
+    AsyncRecordDocuments,
+    AsyncRecordParcels,
+    AsyncRecords,
+    AsyncRecordTypes,
+)
+from .resources.base import BaseResource
+from .util.access_token import AccelaAccessToken, TokenProvider
+from .util.cache import ResponseCache
+from .util.document_store import DocumentStore
+from .util.http_cache import HTTPCache
+from .util.json_codec import JSONCodec
+from .util.rate_limit import THROTTLE_STATUS_CODES, AdaptiveConcurrency, RateLimiter
+from .util.retry import CircuitBreaker, RetryPolicy
+
+
+class AsyncAccelaClient(BaseAccelaClient):
+    """Asyncio client for interacting with the Accela API.
+
+    Requires the optional `httpx` dependency: `uv add "accela[async] @ git+https://github.com/atwalsh/accela"`
+    """
+
+    RESOURCE_CLASSES: ClassVar[Dict[str, Type[BaseResource]]] = {
+        "agencies": AsyncAgencies,
+        "agency_environments": AsyncAgencyEnvironments,
+        "records": AsyncRecords,
+        "record_addresses": AsyncRecordAddresses,
+        "record_documents": AsyncRecordDocuments,
+        "record_parcels": AsyncRecordParcels,
+        "documents": AsyncDocuments,
+        "modules": AsyncModules,
+        "record_types": AsyncRecordTypes,
+    }
+
+    # Hinting
+    agencies: AsyncAgencies
+    agency_environments: AsyncAgencyEnvironments
+    records: AsyncRecords
+    record_addresses: AsyncRecordAddresses
+    record_documents: AsyncRecordDocuments
+    record_parcels: AsyncRecordParcels
+    documents: AsyncDocuments
+    modules: AsyncModules
+    record_types: AsyncRecordTypes
+
+    def __init__(
+            self,
+            access_token: Union[str, AccelaAccessToken, TokenProvider],
+            agency: Optional[str] = None,
+            environment: Optional[str] = None,
+            timezone: Optional[ZoneInfo] = None,
+            max_connections: int = 100,
+            max_keepalive_connections: int = 20,
+            keepalive_expiry: Optional[float] = 5.0,
+            timeout: Optional[float] = None,
+            cache: Optional[ResponseCache] = None,
+            http_cache: Optional[HTTPCache] = None,
+            document_store: Optional[DocumentStore] = None,
+            lazy_models: bool = False,
+            compact_models: bool = False,
+            keep_raw_json: bool = True,
+            stream_json: bool = False,
+            json_codec: Union[str, JSONCodec, None] = None,
+            rate_limit: Union[float, RateLimiter, None] = None,
+            adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+            throttle_retries: int = 5,
+            retry: Union[bool, RetryPolicy] = True,
+            circuit_breaker: Union[bool, CircuitBreaker] = False,
+    ):
+        """
+        Initialize the async Accela client.
+
+        Args:
+            access_token: Accela API access token, an AccelaAccessToken, or a TokenProvider that refreshes the
+                token before it expires and after a 401
+            agency: Optional agency name; e.g. 'CHARLOTTE'. Required for agency-specific resources.
+            environment: Optional environment name; e.g. 'PROD'. Required for agency-specific resources.
+            timezone: Optional timezone for converting naive datetime strings from API to timezone-aware datetimes
+            max_connections: Maximum number of concurrent connections, default 100
+            max_keepalive_connections: Maximum number of idle connections kept open, default 20
+            keepalive_expiry: Seconds an idle connection is kept open, default 5
+            timeout: Optional request timeout in seconds; no timeout by default
+            cache: Optional ResponseCache for slow-changing settings endpoints
+            http_cache: Optional HTTPCache used to revalidate GET responses with ETag / Last-Modified
+            document_store: Optional DocumentStore that download_many() serves unchanged documents from
+                and adds downloaded documents to
+            lazy_models: Decode nested objects and datetimes on first attribute access instead of up front
+            compact_models: Store model fields in slots instead of a per-instance dict to reduce memory
+            keep_raw_json: Keep each model's raw API response in raw_json, default True
+            stream_json: Parse list pages item by item as the body arrives instead of buffering the whole
+                response; streamed pages are not stored in or revalidated against http_cache, and are always
+                decoded with the stdlib json module whatever json_codec is
+            json_codec: JSON backend for response bodies: "orjson", "ujson", "json" or a JSONCodec; defaults to
+                the fastest installed one (see accela.util.json_codec.set_default_codec)
+            rate_limit: Optional maximum requests per second, or a RateLimiter to share between clients
+            adaptive_concurrency: Limit requests in flight with AIMD, backing off on 429 / 503 and ramping up while
+                latency stays healthy; True for the defaults or an AdaptiveConcurrency to share between clients
+            throttle_retries: How many times to retry a request answered with 429 / 503, waiting for the
+                Retry-After header or backing off exponentially, default 5
+            retry: RetryPolicy for GETs that fail with a server or connection error; True (the default) retries
+                up to 3 times with jittered exponential backoff, False disables retries
+            circuit_breaker: Fail fast with CircuitOpenError while an endpoint family (records, documents,
+                settings, ...) keeps failing; True for the defaults or a CircuitBreaker to share between clients
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncAccelaClient requires httpx. Install it with the 'async' extra: accela[async]"
+            ) from e
+
+        super().__init__(
+            access_token,
+            agency=agency,
+            environment=environment,
+            timezone=timezone,
+            cache=cache,
+            http_cache=http_cache,
+            document_store=document_store,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            keep_raw_json=keep_raw_json,
+            stream_json=stream_json,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            adaptive_concurrency=adaptive_concurrency,
+            throttle_retries=throttle_retries,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+        )
+
+        # Transport failures that are retried for idempotent requests
+        self._retryable_errors = (httpx.TransportError,)
+        self.session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's pooled connections."""
+        await self.session.aclose()
+
+    async def request(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            stream: bool = False,
+    ):
+        """Send a request to the Accela API over the client's pooled async session.
+
+        Args:
+            method: HTTP method
+            url: The API endpoint URL
+            params: Optional query parameters
+            headers: Optional headers to send in addition to the default headers
+            stream: Whether to defer downloading the response body
+
+        Returns:
+            The httpx.Response object
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails after any retries
+            CircuitOpenError: If the circuit breaker is failing fast for the URL's endpoint family
+        """
+        if self.token_provider is not None:
+            # Refresh off the event loop, so the headers below read a fresh token
+            await self.token_provider.aget_token()
+        request_headers = self.headers
+        if headers:
+            request_headers.update(headers)
+
+        attempts = _Attempts(self, method, url)
+        while True:
+            attempts.check_circuit()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            if self.concurrency_limiter is not None:
+                await self.concurrency_limiter.acquire_async()
+            started = time.monotonic()
+            try:
+                request = self.session.build_request(method, url, headers=request_headers, params=params)
+                response = await self.session.send(request, stream=stream)
+            except self._retryable_errors:
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release(None)
+                delay = attempts.after_error()
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release(None)
+                raise
+            throttled = response.status_code in THROTTLE_STATUS_CODES
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release(time.monotonic() - started, throttled=throttled)
+
+            if response.status_code == 401 and self.token_provider is not None and not attempts.reauthenticated:
+                attempts.reauthenticated = True
+                await response.aclose()
+                request_headers["Authorization"] = await self.token_provider.ainvalidate(
+                    request_headers["Authorization"]
+                )
+                continue
+            delay = attempts.after_response(response.status_code, response.headers)
+            if delay is None:
+                break
+            await response.aclose()
+            if throttled and self.rate_limiter is not None:
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+
+        if response.is_error:
+            if stream:
+                await response.aclose()
+            response.raise_for_status()
+        return response
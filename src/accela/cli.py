@@ -0,0 +1,210 @@
+"""Command-line interface for bulk operations against the Accela API.
+
+Credentials are read from flags or the ACCELA_ACCESS_TOKEN, ACCELA_AGENCY and ACCELA_ENVIRONMENT environment
+variables. Examples:
+
+    accela records export exports/ --format parquet --module Building --concurrency 8 --rate-limit 20
+    accela documents fetch 1001 1002 1003 --output docs/
+    accela settings dump --output settings.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import requests
+
+from .client import AccelaClient
+from .export import WRITERS, Exporter
+from .resources.documents import DownloadSizeError
+from .util.retry import CircuitOpenError
+
+
+def _format_bytes(count: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024:
+            return f"{count:,.1f} {unit}"
+        count /= 1024
+    return f"{count:,.1f} GiB"
+
+
+def _print_summary(client: AccelaClient, elapsed: float, items: int, noun: str, bytes_written: int) -> None:
+    """Print request, item and byte throughput to stderr."""
+    elapsed = max(elapsed, 1e-9)
+    stats = client.connection_stats
+    print(f"{stats.requests:,} requests in {elapsed:,.1f}s ({stats.requests / elapsed:,.1f}/s)", file=sys.stderr)
+    print(f"{items:,} {noun} ({items / elapsed:,.1f} {noun}/s)", file=sys.stderr)
+    print(
+        f"{_format_bytes(stats.bytes_received)} received ({_format_bytes(stats.bytes_received / elapsed)}/s), "
+        f"{_format_bytes(bytes_written)} written",
+        file=sys.stderr,
+    )
+
+
+def _client(args: argparse.Namespace) -> AccelaClient:
+    return AccelaClient(
+        access_token=args.token,
+        agency=args.agency,
+        environment=args.environment,
+        timezone=ZoneInfo(args.timezone) if args.timezone else None,
+        # One pooled connection per worker, so parallel requests do not open throwaway connections
+        pool_maxsize=max(10, args.concurrency),
+        rate_limit=args.rate_limit,
+    )
+
+
+def _filters(args: argparse.Namespace) -> Dict[str, Any]:
+    filters = {}
+    for name in ("module", "type", "status", "opened_date_from", "opened_date_to", "fields"):
+        value = getattr(args, name)
+        if value is not None:
+            filters[name] = value
+    return filters
+
+
+def _records_export(args: argparse.Namespace, client: AccelaClient) -> Tuple[int, str, int]:
+    exporter = Exporter(
+        client,
+        args.output,
+        source=args.source,
+        format=args.format,
+        compress=args.compress,
+        max_rows=args.max_rows,
+        max_bytes=args.max_bytes,
+        checkpoint=args.checkpoint,
+        limit=args.page_size,
+        concurrency=args.concurrency,
+        **_filters(args),
+    )
+    result = exporter.run()
+    if result.resumed:
+        print(f"Resumed from checkpoint {args.checkpoint}", file=sys.stderr)
+    for path in result.files:
+        print(path)
+    return result.rows, args.source, result.bytes_written
+
+
+def _documents_fetch(args: argparse.Namespace, client: AccelaClient) -> Tuple[int, str, int]:
+    results = client.documents.download_many(args.ids, args.output, concurrency=args.concurrency)
+    for result in results:
+        print(result.path)
+    return len(results), "documents", sum(result.size - result.resumed_from for result in results)
+
+
+def _settings_dump(args: argparse.Namespace, client: AccelaClient) -> Tuple[int, str, int]:
+    modules = client.modules.list()
+    record_types = {}
+    for module in modules:
+        page = client.record_types.list(module=module.value, limit=args.page_size)
+        record_types[module.value] = [record_type.to_dict() for record_type in page.auto_paging_iter()]
+    settings = {
+        "agency": client.agency,
+        "environment": client.environment,
+        "modules": [module.to_dict() for module in modules],
+        "record_types": record_types,
+    }
+
+    output = client.json_codec.dumps(settings, pretty=True) + "\n"
+    if args.output and args.output != "-":
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+    return sum(len(types) for types in record_types.values()), "record types", len(output.encode("utf-8"))
+
+
+def _add_connection_arguments(parser: argparse.ArgumentParser, defaults: bool) -> None:
+    """Add the credential and timezone flags.
+
+    They are accepted before and after the command. Only the top-level parser sets defaults; a subparser
+    default would overwrite a flag given before the command.
+    """
+    def default(value: Optional[str]) -> Any:
+        return value if defaults else argparse.SUPPRESS
+
+    parser.add_argument("--token", default=default(os.environ.get("ACCELA_ACCESS_TOKEN")),
+                        help="access token (default: $ACCELA_ACCESS_TOKEN)")
+    parser.add_argument("--agency", default=default(os.environ.get("ACCELA_AGENCY")),
+                        help="agency name (default: $ACCELA_AGENCY)")
+    parser.add_argument("--environment", default=default(os.environ.get("ACCELA_ENVIRONMENT")),
+                        help="environment name (default: $ACCELA_ENVIRONMENT)")
+    parser.add_argument("--timezone", default=default(None),
+                        help="timezone for the agency's naive datetimes, e.g. America/New_York")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the accela command."""
+    parser = argparse.ArgumentParser(
+        prog="accela", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    _add_connection_arguments(parser, defaults=True)
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    # Flags shared by every command
+    tuning = argparse.ArgumentParser(add_help=False)
+    _add_connection_arguments(tuning, defaults=False)
+    tuning.add_argument("--concurrency", type=int, default=4, help="parallel requests (default: 4)")
+    tuning.add_argument("--page-size", type=int, default=100, help="items per page (default: 100)")
+    tuning.add_argument("--rate-limit", type=float, help="maximum requests per second")
+
+    records = groups.add_parser("records", help="record operations").add_subparsers(dest="command", required=True)
+    export = records.add_parser("export", parents=[tuning], help="export records to rotating files")
+    export.add_argument("output", help="output directory")
+    export.add_argument("--source", choices=list(Exporter.SOURCES), default="records",
+                        help="export records or their addresses or parcels (default: records)")
+    export.add_argument("--format", choices=list(WRITERS), default="ndjson", help="output format (default: ndjson)")
+    export.add_argument("--compress", action="store_true", help="gzip NDJSON/CSV, zstd Parquet")
+    export.add_argument("--max-rows", type=int, help="start a new file after this many rows")
+    export.add_argument("--max-bytes", type=int, help="start a new file after this many bytes")
+    export.add_argument("--checkpoint", help="checkpoint file for resuming an interrupted export")
+    export.add_argument("--module", help="filter by module")
+    export.add_argument("--type", help="filter by record type")
+    export.add_argument("--status", help="filter by record status")
+    export.add_argument("--opened-date-from", type=datetime.fromisoformat, help="filter by open date, e.g. 2024-01-01")
+    export.add_argument("--fields", type=lambda value: value.split(","),
+                        help="comma-separated record fields to export, e.g. status,statusDate (id is always included)")
+    export.add_argument("--opened-date-to", type=datetime.fromisoformat, help="filter by open date, e.g. 2024-12-31")
+    export.set_defaults(handler=_records_export)
+
+    documents = groups.add_parser("documents", help="document operations").add_subparsers(dest="command", required=True)
+    fetch = documents.add_parser("fetch", parents=[tuning], help="download documents by ID")
+    fetch.add_argument("ids", nargs="+", type=int, help="document IDs")
+    fetch.add_argument("--output", default=".", help="output directory (default: current directory)")
+    fetch.set_defaults(handler=_documents_fetch)
+
+    settings = groups.add_parser("settings", help="agency settings").add_subparsers(dest="command", required=True)
+    dump = settings.add_parser("dump", parents=[tuning], help="dump modules and record types as JSON")
+    dump.add_argument("--output", help="output file (default: stdout)")
+    dump.set_defaults(handler=_settings_dump)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for the accela command."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("an access token is required: pass --token or set ACCELA_ACCESS_TOKEN")
+    if not (args.agency and args.environment):
+        parser.error("--agency and --environment are required (or set ACCELA_AGENCY and ACCELA_ENVIRONMENT)")
+
+    started = time.monotonic()
+    try:
+        with _client(args) as client:
+            items, noun, bytes_written = args.handler(args, client)
+    except (requests.RequestException, CircuitOpenError, DownloadSizeError, OSError) as e:
+        # Rejected or expired tokens surface as HTTP errors; disk full and permission errors as OSError
+        print(f"accela: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    _print_summary(client, time.monotonic() - started, items, noun, bytes_written)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,9 @@
-from typing import ClassVar, Dict, Optional, Type
+import time
+from typing import Any, ClassVar, Dict, Optional, Type, Union
 from zoneinfo import ZoneInfo
 
+import requests
+
 from .resources.agencies import Agencies
 from .resources.agency_environments import AgencyEnvironments
 from .resources.base import BaseResource
@@ -11,57 +14,124 @@ from .resources.record_documents import RecordDocuments
 from .resources.record_parcels import RecordParcels
 from .resources.record_types import RecordTypes
 from .resources.records import Records
+from .util.access_token import AccelaAccessToken, TokenProvider
+from .util.cache import ResponseCache
+from .util.document_store import DocumentStore
+from .util.http_cache import HTTPCache
+from .util.json_codec import JSONCodec, get_codec, get_default_codec
+from .util.rate_limit import THROTTLE_STATUS_CODES, AdaptiveConcurrency, RateLimiter, retry_after_seconds
+from .util.retry import CircuitBreaker, RetryPolicy, endpoint_family
+from .util.session import ConnectionStats, create_session
 
 
-class AccelaClient:
-    """Main client for interacting with the Accela API."""
+class _Attempts:
+    """Retry and circuit breaker bookkeeping for a single request, shared by the sync and async clients."""
 
-    BASE_URL = "https://apis.accela.com/v4"
+    def __init__(self, client: "BaseAccelaClient", method: str, url: str):
+        self.client = client
+        self.method = method
+        self.family = endpoint_family(url)
+        self.started = time.monotonic()
+        self.throttles = 0
+        self.retries = 0
+        self.reauthenticated = False
 
-    # Define resource classes to be automatically initialized
-    RESOURCE_CLASSES: ClassVar[Dict[str, Type[BaseResource]]] = {
-        "agencies": Agencies,
-        "agency_environments": AgencyEnvironments,
-        "records": Records,
-        "record_addresses": RecordAddresses,
-        "record_documents": RecordDocuments,
-        "record_parcels": RecordParcels,
-        "documents": Documents,
-        "modules": Modules,
-        "record_types": RecordTypes,
-    }
+    def check_circuit(self) -> None:
+        """Raise CircuitOpenError if the request's endpoint family is failing fast."""
+        if self.client.circuit_breaker is not None:
+            self.client.circuit_breaker.before_request(self.family)
 
-    # Hinting
-    agencies: Agencies
-    agency_environments: AgencyEnvironments
-    records: Records
-    record_addresses: RecordAddresses
-    record_documents: RecordDocuments
-    record_parcels: RecordParcels
-    documents: Documents
-    modules: Modules
-    record_types: RecordTypes
+    def after_response(self, status_code: int, headers) -> Optional[float]:
+        """Record a response, returning how long to wait before sending the request again, or None to keep it."""
+        breaker = self.client.circuit_breaker
+        if breaker is not None:
+            if status_code >= 500:
+                breaker.record_failure(self.family)
+            else:
+                breaker.record_success(self.family)
+
+        if status_code in THROTTLE_STATUS_CODES and self.throttles < self.client.throttle_retries:
+            self.throttles += 1
+            return self.client._throttle_delay(headers, self.throttles - 1)
+        policy = self.client.retry_policy
+        if policy is not None and status_code in policy.status_codes:
+            return self._backoff()
+        return None
+
+    def after_error(self) -> Optional[float]:
+        """Record a connection error or timeout, returning how long to wait before retrying, or None to raise it."""
+        if self.client.circuit_breaker is not None:
+            self.client.circuit_breaker.record_failure(self.family)
+        return self._backoff()
+
+    def _backoff(self) -> Optional[float]:
+        policy = self.client.retry_policy
+        if policy is None:
+            return None
+        delay = policy.next_delay(self.method, self.retries, time.monotonic() - self.started)
+        if delay is not None:
+            self.retries += 1
+        return delay
+
+
+class BaseAccelaClient:
+    """Shared configuration and lazy resource handling for the sync and async clients."""
+
+    BASE_URL = "https://apis.accela.com/v4"
+
+    RESOURCE_CLASSES: ClassVar[Dict[str, Type[BaseResource]]] = {}
 
     def __init__(
             self,
-            access_token: str,
+            access_token: Union[str, AccelaAccessToken, TokenProvider],
             agency: Optional[str] = None,
             environment: Optional[str] = None,
             timezone: Optional[ZoneInfo] = None,
+            cache: Optional[ResponseCache] = None,
+            http_cache: Optional[HTTPCache] = None,
+            document_store: Optional[DocumentStore] = None,
+            lazy_models: bool = False,
+            compact_models: bool = False,
+            keep_raw_json: bool = True,
+            stream_json: bool = False,
+            json_codec: Union[str, JSONCodec, None] = None,
+            rate_limit: Union[float, RateLimiter, None] = None,
+            adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+            throttle_retries: int = 5,
+            retry: Union[bool, RetryPolicy] = True,
+            circuit_breaker: Union[bool, CircuitBreaker] = False,
     ):
-        """
-        Initialize the Accela client.
+        if lazy_models and (compact_models or not keep_raw_json):
+            raise ValueError("lazy_models requires keep_raw_json=True and cannot be combined with compact_models")
 
-        Args:
-            access_token: Accela API access token
-            agency: Optional agency name; e.g. 'CHARLOTTE'. Required for agency-specific resources.
-            environment: Optional environment name; e.g. 'PROD'. Required for agency-specific resources.
-            timezone: Optional timezone for converting naive datetime strings from API to timezone-aware datetimes
-        """
-        self.access_token = access_token
+        self.token_provider: Optional[TokenProvider] = None
+        self._access_token: Optional[str] = None
+        if isinstance(access_token, TokenProvider):
+            self.token_provider = access_token
+        elif isinstance(access_token, AccelaAccessToken):
+            self._access_token = access_token.access_token
+        else:
+            self._access_token = access_token
         self.agency = agency
         self.environment = environment
         self.timezone = timezone
+        self.cache = cache
+        self.http_cache = http_cache
+        self.document_store = document_store
+        self.lazy_models = lazy_models
+        self.compact_models = compact_models
+        self.keep_raw_json = keep_raw_json
+        self.stream_json = stream_json
+        self.json_codec = get_codec(json_codec) if isinstance(json_codec, str) else (json_codec or get_default_codec())
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter = rate_limit
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AdaptiveConcurrency()
+        self.concurrency_limiter = adaptive_concurrency or None
+        self.throttle_retries = throttle_retries
+        self.retry_policy = RetryPolicy() if retry is True else (retry or None)
+        self.circuit_breaker = CircuitBreaker() if circuit_breaker is True else (circuit_breaker or None)
 
         # Store resource classes for lazy initialization
         self._resource_instances = {}
@@ -87,6 +157,18 @@ class AccelaClient:
         if name in self._resource_instances:
             del self._resource_instances[name]
 
+    @property
+    def access_token(self) -> str:
+        """The access token sent with requests; a token provider refreshes it first if it is about to expire."""
+        if self.token_provider is not None:
+            return self.token_provider.get_token()
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        self._access_token = value
+        self.token_provider = None
+
     @property
     def headers(self) -> Dict[str, str]:
         """Default headers for Accela API requests."""
@@ -101,3 +183,217 @@ class AccelaClient:
             headers["x-accela-environment"] = self.environment
             
         return headers
+
+    def _throttle_delay(self, response_headers, attempt: int) -> float:
+        """Seconds to wait before retrying a throttled request: the server's Retry-After, else exponential backoff."""
+        delay = retry_after_seconds(response_headers)
+        return min(2 ** attempt, 30) if delay is None else delay
+
+
+class AccelaClient(BaseAccelaClient):
+    """Main client for interacting with the Accela API."""
+
+    # Define resource classes to be automatically initialized
+    RESOURCE_CLASSES: ClassVar[Dict[str, Type[BaseResource]]] = {
+        "agencies": Agencies,
+        "agency_environments": AgencyEnvironments,
+        "records": Records,
+        "record_addresses": RecordAddresses,
+        "record_documents": RecordDocuments,
+        "record_parcels": RecordParcels,
+        "documents": Documents,
+        "modules": Modules,
+        "record_types": RecordTypes,
+    }
+
+    # Hinting
+    agencies: Agencies
+    agency_environments: AgencyEnvironments
+    records: Records
+    record_addresses: RecordAddresses
+    record_documents: RecordDocuments
+    record_parcels: RecordParcels
+    documents: Documents
+    modules: Modules
+    record_types: RecordTypes
+
+    def __init__(
+            self,
+            access_token: Union[str, AccelaAccessToken, TokenProvider],
+            agency: Optional[str] = None,
+            environment: Optional[str] = None,
+            timezone: Optional[ZoneInfo] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            cache: Optional[ResponseCache] = None,
+            http_cache: Optional[HTTPCache] = None,
+            document_store: Optional[DocumentStore] = None,
+            lazy_models: bool = False,
+            compact_models: bool = False,
+            keep_raw_json: bool = True,
+            stream_json: bool = False,
+            json_codec: Union[str, JSONCodec, None] = None,
+            rate_limit: Union[float, RateLimiter, None] = None,
+            adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+            throttle_retries: int = 5,
+            retry: Union[bool, RetryPolicy] = True,
+            circuit_breaker: Union[bool, CircuitBreaker] = False,
+    ):
+        """
+        Initialize the Accela client.
+
+        Args:
+            access_token: Accela API access token, an AccelaAccessToken, or a TokenProvider that refreshes the
+                token before it expires and after a 401
+            agency: Optional agency name; e.g. 'CHARLOTTE'. Required for agency-specific resources.
+            environment: Optional environment name; e.g. 'PROD'. Required for agency-specific resources.
+            timezone: Optional timezone for converting naive datetime strings from API to timezone-aware datetimes
+            pool_connections: Number of per-host connection pools to keep, default 10
+            pool_maxsize: Maximum number of connections kept open per host, default 10
+            pool_block: Block when a host's pool is exhausted instead of opening a throwaway connection
+            keep_alive: Keep connections open between requests, default True
+            cache: Optional ResponseCache for slow-changing settings endpoints
+            http_cache: Optional HTTPCache used to revalidate GET responses with ETag / Last-Modified
+            document_store: Optional DocumentStore that download_many() serves unchanged documents from
+                and adds downloaded documents to
+            lazy_models: Decode nested objects and datetimes on first attribute access instead of up front
+            compact_models: Store model fields in slots instead of a per-instance dict to reduce memory
+            keep_raw_json: Keep each model's raw API response in raw_json, default True
+            stream_json: Parse list pages item by item as the body arrives instead of buffering the whole
+                response; streamed pages are not stored in or revalidated against http_cache, and are always
+                decoded with the stdlib json module whatever json_codec is
+            json_codec: JSON backend for response bodies: "orjson", "ujson", "json" or a JSONCodec; defaults to
+                the fastest installed one (see accela.util.json_codec.set_default_codec)
+            rate_limit: Optional maximum requests per second, or a RateLimiter to share between clients
+            adaptive_concurrency: Limit requests in flight with AIMD, backing off on 429 / 503 and ramping up while
+                latency stays healthy; True for the defaults or an AdaptiveConcurrency to share between clients
+            throttle_retries: How many times to retry a request answered with 429 / 503, waiting for the
+                Retry-After header or backing off exponentially, default 5
+            retry: RetryPolicy for GETs that fail with a server or connection error; True (the default) retries
+                up to 3 times with jittered exponential backoff, False disables retries
+            circuit_breaker: Fail fast with CircuitOpenError while an endpoint family (records, documents,
+                settings, ...) keeps failing; True for the defaults or a CircuitBreaker to share between clients
+        """
+        super().__init__(
+            access_token,
+            agency=agency,
+            environment=environment,
+            timezone=timezone,
+            cache=cache,
+            http_cache=http_cache,
+            document_store=document_store,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            keep_raw_json=keep_raw_json,
+            stream_json=stream_json,
+            json_codec=json_codec,
+            rate_limit=rate_limit,
+            adaptive_concurrency=adaptive_concurrency,
+            throttle_retries=throttle_retries,
+            retry=retry,
+            circuit_breaker=circuit_breaker,
+        )
+
+        # Shared connection pool used by every resource and paginator
+        self._connection_stats = ConnectionStats()
+        self.session = create_session(
+            self._connection_stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        self.session.close()
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Request and connection counters for the client's connection pool."""
+        return self._connection_stats
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            stream: bool = False,
+    ) -> requests.Response:
+        """Send a request to the Accela API over the client's pooled session.
+
+        Args:
+            method: HTTP method
+            url: The API endpoint URL
+            params: Optional query parameters
+            headers: Optional headers to send in addition to the default headers
+            stream: Whether to defer downloading the response body
+
+        Returns:
+            The Response object
+
+        Raises:
+            requests.HTTPError: If the request fails after any retries
+            CircuitOpenError: If the circuit breaker is failing fast for the URL's endpoint family
+        """
+        request_headers = self.headers
+        if headers:
+            request_headers.update(headers)
+
+        attempts = _Attempts(self, method, url)
+        while True:
+            attempts.check_circuit()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, headers=request_headers, params=params, stream=stream)
+            except (requests.ConnectionError, requests.Timeout):
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release(None)
+                delay = attempts.after_error()
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.release(None)
+                raise
+            throttled = response.status_code in THROTTLE_STATUS_CODES
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release(time.monotonic() - started, throttled=throttled)
+
+            # Streamed bodies are read by the caller, so count their advertised length instead
+            self._connection_stats.record_bytes(
+                int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+            )
+            if response.status_code == 401 and self.token_provider is not None and not attempts.reauthenticated:
+                # The token was revoked or expired early: refresh once, unless another request already did
+                attempts.reauthenticated = True
+                response.close()
+                request_headers["Authorization"] = self.token_provider.invalidate(request_headers["Authorization"])
+                continue
+            delay = attempts.after_response(response.status_code, response.headers)
+            if delay is None:
+                break
+            response.close()
+            if throttled and self.rate_limiter is not None:
+                # Hold every request sharing the limiter, not just this one
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+
+        response.raise_for_status()
+        return response
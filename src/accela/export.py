@@ -0,0 +1,448 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import types
+import typing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .resources.record_addresses import RecordAddress
+from .resources.record_parcels import RecordParcel
+from .resources.records import Record
+
+
+def _unwrap_optional(hint: Any) -> Any:
+    args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+    if typing.get_origin(hint) in (typing.Union, types.UnionType) and len(args) == 1:
+        hint = args[0]
+    return typing.get_origin(hint) or hint
+
+
+def _export_fields(model_class: type, projection: Optional[List[str]] = None) -> List[str]:
+    """Model fields written to each row, limited to a `fields` projection when the source was listed with one."""
+    names = [f.name for f in fields(model_class) if f.name != "raw_json" and f.name not in model_class.ATTACHED_FIELDS]
+    if projection:
+        projected = {model_class.FIELD_MAPPING.get(name, name) for name in model_class.api_fields(projection)}
+        names = [name for name in names if name in projected]
+    return names
+
+
+class _NDJSONWriter:
+    """One JSON object per line, optionally gzip compressed."""
+
+    extension = "ndjson"
+
+    def __init__(self, path: str, model_class: type, client, compress: bool, projection: Optional[List[str]] = None):
+        self._raw = open(path, "wb")
+        self._out = gzip.GzipFile(fileobj=self._raw, mode="wb") if compress else self._raw
+        self._dumps = client.json_codec.dumps
+        self._fields = _export_fields(model_class, projection) if projection else None
+
+    @property
+    def size(self) -> int:
+        return self._raw.tell()
+
+    def write(self, items: List[Any]) -> None:
+        dumps = self._dumps
+        rows = [item.to_dict() for item in items]
+        if self._fields is not None:
+            rows = [{name: row[name] for name in self._fields} for row in rows]
+        self._out.write("".join(dumps(row) + "\n" for row in rows).encode("utf-8"))
+
+    def close(self) -> None:
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+
+
+class _CSVWriter:
+    """CSV with nested objects flattened into dotted columns, e.g. status.value, and lists written as JSON.
+
+    The header of each file is taken from its first rows; flattened keys that first appear later are kept
+    as a JSON object in the trailing _extra column.
+    """
+
+    extension = "csv"
+    SAMPLE_ROWS = 1000
+
+    def __init__(self, path: str, model_class: type, client, compress: bool, projection: Optional[List[str]] = None):
+        self._raw = open(path, "wb")
+        self._binary = gzip.GzipFile(fileobj=self._raw, mode="wb") if compress else self._raw
+        self._out = io.TextIOWrapper(self._binary, encoding="utf-8", newline="")
+        self._writer = csv.writer(self._out)
+        self._fields = _export_fields(model_class, projection)
+        self._dumps = client.json_codec.dumps
+        self._header: Optional[List[str]] = None
+        self._sample: List[Dict[str, Any]] = []
+
+    @property
+    def size(self) -> int:
+        self._out.flush()
+        return self._raw.tell()
+
+    def _flatten(self, item: Any) -> Dict[str, Any]:
+        row = {}
+        for name in self._fields:
+            value = getattr(item, name)
+            if isinstance(value, dict):
+                self._flatten_dict(value, name, row)
+            elif isinstance(value, list):
+                row[name] = self._dumps(value)
+            elif isinstance(value, datetime):
+                row[name] = value.isoformat()
+            else:
+                row[name] = value
+        return row
+
+    def _flatten_dict(self, value: Dict[str, Any], prefix: str, row: Dict[str, Any]) -> None:
+        for key, nested in value.items():
+            name = f"{prefix}.{key}"
+            if isinstance(nested, dict):
+                self._flatten_dict(nested, name, row)
+            elif isinstance(nested, list):
+                row[name] = self._dumps(nested)
+            else:
+                row[name] = nested
+
+    def _write_header(self) -> None:
+        # Keep the model's field order, with each nested object's columns where the object would be
+        seen = {}
+        for row in self._sample:
+            for name in row:
+                seen.setdefault(name.split(".", 1)[0], {}).setdefault(name, None)
+        self._header = [name for field_name in self._fields for name in seen.get(field_name, {field_name: None})]
+        self._columns = set(self._header)
+        self._writer.writerow(self._header + ["_extra"])
+        self._write_rows(self._sample)
+        self._sample = []
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        header = self._header
+        columns = self._columns
+        for row in rows:
+            extra = {name: value for name, value in row.items() if name not in columns}
+            values = [row.get(name) for name in header]
+            values.append(self._dumps(extra) if extra else None)
+            self._writer.writerow(values)
+
+    def write(self, items: List[Any]) -> None:
+        rows = [self._flatten(item) for item in items]
+        if self._header is not None:
+            self._write_rows(rows)
+            return
+        self._sample += rows
+        if len(self._sample) >= self.SAMPLE_ROWS:
+            self._write_header()
+
+    def close(self) -> None:
+        if self._header is None:
+            self._write_header()
+        self._out.close()
+        if self._binary is not self._raw:
+            self._raw.close()
+
+
+class _ParquetWriter:
+    """Parquet file written one row group at a time; nested objects and lists are stored as JSON strings."""
+
+    extension = "parquet"
+    ROW_GROUP_SIZE = 10_000
+
+    def __init__(self, path: str, model_class: type, client, compress: bool, projection: Optional[List[str]] = None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with the 'export' extra: accela[export]"
+            ) from e
+
+        self._pa = pyarrow
+        self._fields = _export_fields(model_class, projection)
+        self._dumps = client.json_codec.dumps
+        hints = typing.get_type_hints(model_class)
+        timezone = str(client.timezone) if client.timezone else None
+
+        arrow_fields = []
+        self._json_fields = set()
+        for name in self._fields:
+            hint = _unwrap_optional(hints.get(name))
+            if hint is bool:
+                arrow_type = pyarrow.bool_()
+            elif hint is float:
+                arrow_type = pyarrow.float64()
+            elif hint is int:
+                arrow_type = pyarrow.int64()
+            elif hint is datetime:
+                arrow_type = pyarrow.timestamp("s", tz=timezone)
+            else:
+                arrow_type = pyarrow.string()
+                if hint is not str:
+                    self._json_fields.add(name)
+            arrow_fields.append(pyarrow.field(name, arrow_type))
+        self._schema = pyarrow.schema(arrow_fields)
+
+        self._sink = pyarrow.OSFile(path, "wb")
+        self._writer = pyarrow.parquet.ParquetWriter(
+            self._sink, self._schema, compression="zstd" if compress else "snappy"
+        )
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self._fields}
+        self._buffered = 0
+
+    @property
+    def size(self) -> int:
+        return self._sink.tell()
+
+    def write(self, items: List[Any]) -> None:
+        dumps = self._dumps
+        for name, column in self._columns.items():
+            values = [getattr(item, name) for item in items]
+            if name in self._json_fields:
+                values = [None if value is None else dumps(value) for value in values]
+            column += values
+        self._buffered += len(items)
+        if self._buffered >= self.ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffered:
+            return
+        self._writer.write_table(self._pa.Table.from_pydict(self._columns, schema=self._schema))
+        self._columns = {name: [] for name in self._fields}
+        self._buffered = 0
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+        self._sink.close()
+
+
+WRITERS = {
+    "ndjson": _NDJSONWriter,
+    "csv": _CSVWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+@dataclass
+class ExportResult:
+    """Summary of an export run."""
+
+    files: List[str] = field(default_factory=list)
+    rows: int = 0
+    bytes_written: int = 0
+    resumed: bool = False
+
+
+class Exporter:
+    """Streams every record, record address or record parcel of an agency to rotating files on disk.
+
+    Items are written as they are paged in, so memory stays bounded by the page size and, for Parquet, the
+    row group size. Each output file is written under a .tmp name and renamed once complete. With a
+    checkpoint file, progress is saved each time a file is completed, and a later run with the same
+    arguments continues from there instead of starting over; the checkpoint is removed when the export
+    finishes. Use max_rows or max_bytes to bound how much work an interruption can lose.
+    """
+
+    SOURCES = {
+        "records": Record,
+        "addresses": RecordAddress,
+        "parcels": RecordParcel,
+    }
+
+    def __init__(
+            self,
+            client,
+            directory: Union[str, os.PathLike],
+            source: str = "records",
+            format: str = "ndjson",  # noqa
+            compress: bool = False,
+            max_rows: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            checkpoint: Optional[Union[str, os.PathLike]] = None,
+            limit: int = 100,
+            concurrency: int = 1,
+            prefix: Optional[str] = None,
+            **filters: Any,
+    ):
+        """
+        Args:
+            client: AccelaClient to export through
+            directory: Directory the output files are written to; created if missing
+            source: What to export: "records", "addresses" or "parcels" (of every matching record)
+            format: Output format: "ndjson", "csv" or "parquet" (requires pyarrow)
+            compress: Gzip NDJSON and CSV files; Parquet files use zstd instead of snappy
+            max_rows: Optional number of rows after which a new output file is started
+            max_bytes: Optional file size in bytes after which a new output file is started
+            checkpoint: Optional JSON file used to resume an interrupted export
+            limit: Number of items per page, default 100
+            concurrency: Number of pages (or records' addresses / parcels) fetched in parallel, default 1
+            prefix: Output file name prefix, default the source name
+            **filters: Any Records.list() filter, e.g. module or opened_date_from; `fields` also limits the
+                columns of a records export
+        """
+        if source not in self.SOURCES:
+            raise ValueError(f"Cannot export {source}; expected one of {', '.join(self.SOURCES)}")
+        if format not in WRITERS:
+            raise ValueError(f"Unknown export format {format!r}; expected one of {', '.join(WRITERS)}")
+
+        self.client = client
+        self.directory = os.fspath(directory)
+        self.source = source
+        self.format = format
+        self.compress = compress
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.checkpoint = os.fspath(checkpoint) if checkpoint is not None else None
+        self.limit = limit
+        self.concurrency = concurrency
+        self.prefix = prefix or source
+        self.filters = filters
+
+    @property
+    def key(self) -> str:
+        """Identifies the export a checkpoint belongs to."""
+        spec = json.dumps(
+            [self.client.agency, self.client.environment, self.source, self.format, self.compress, self.prefix,
+             self.filters],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(spec.encode("utf-8")).hexdigest()[:16]
+
+    def _path(self, part: int) -> str:
+        extension = WRITERS[self.format].extension
+        if self.compress and self.format != "parquet":
+            extension += ".gz"
+        return os.path.join(self.directory, f"{self.prefix}-{part:05d}.{extension}")
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return None
+        with open(self.checkpoint, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state["key"] != self.key:
+            raise ValueError(f"Checkpoint {self.checkpoint} belongs to a different export")
+        return state
+
+    def _save_checkpoint(self, state: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.checkpoint))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".accela-export-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.checkpoint)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _record_batches(self, start: int, **projection: Any) -> Iterator[Tuple[List[Any], int]]:
+        """Yield each record with its position, the number of records consumed including it."""
+        page = self.client.records.list(limit=self.limit, offset=start, **{**projection, **self.filters})
+        for position, record in enumerate(page.auto_paging_iter(concurrency=self.concurrency), start + 1):
+            yield [record], position
+
+    def _child_batches(self, start: int, list_children: Callable) -> Iterator[Tuple[List[Any], int]]:
+        """Yield the addresses or parcels of each record, fetching up to `concurrency` records' at once."""
+
+        def fetch(record_id: str) -> List[Any]:
+            return list(list_children(record_id, limit=self.limit).auto_paging_iter())
+
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="accela-export")
+        try:
+            # Only the parent records' ids are needed
+            for (record,), position in self._record_batches(start, fields=["id"]):
+                pending.append((executor.submit(fetch, record.id), position))
+                if len(pending) >= 2 * self.concurrency:
+                    future, done_position = pending.popleft()
+                    yield future.result(), done_position
+            while pending:
+                future, done_position = pending.popleft()
+                yield future.result(), done_position
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _batches(self, start: int) -> Iterator[Tuple[List[Any], int]]:
+        if self.source == "addresses":
+            return self._child_batches(start, self.client.record_addresses.list)
+        if self.source == "parcels":
+            return self._child_batches(start, self.client.record_parcels.list)
+        return self._record_batches(start)
+
+    def run(self) -> ExportResult:
+        """
+        Run the export to completion.
+
+        Returns:
+            ExportResult listing the files written, including those from an earlier interrupted run
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        state = self._load_checkpoint()
+        result = ExportResult(resumed=state is not None)
+        position, part = 0, 0
+        if state is not None:
+            position, part = state["position"], state["part"]
+            result.files, result.rows, result.bytes_written = state["files"], state["rows"], state["bytes_written"]
+
+        model_class = self.SOURCES[self.source]
+        writer_class = WRITERS[self.format]
+        # A fields filter projects the records themselves; child rows are always written in full
+        projection = self.filters.get("fields") if self.source == "records" else None
+        writer = None
+        part_rows = 0
+
+        def finish_part() -> None:
+            nonlocal writer, part
+            writer.close()
+            path = self._path(part)
+            os.replace(path + ".tmp", path)
+            result.files.append(path)
+            result.bytes_written += os.path.getsize(path)
+            part += 1
+            writer = None
+            if self.checkpoint is not None:
+                self._save_checkpoint({
+                    "key": self.key,
+                    "position": position,
+                    "part": part,
+                    "files": result.files,
+                    "rows": result.rows,
+                    "bytes_written": result.bytes_written,
+                })
+
+        try:
+            for items, position in self._batches(position):
+                if items:
+                    if writer is None:
+                        writer = writer_class(
+                            self._path(part) + ".tmp", model_class, self.client, self.compress, projection
+                        )
+                        part_rows = 0
+                    writer.write(items)
+                    part_rows += len(items)
+                    result.rows += len(items)
+                if writer is not None and (
+                        (self.max_rows is not None and part_rows >= self.max_rows)
+                        or (self.max_bytes is not None and writer.size >= self.max_bytes)
+                ):
+                    finish_part()
+            if writer is not None:
+                finish_part()
+        except BaseException:
+            # Leave completed files and the checkpoint in place; the partial file is rewritten on resume
+            if writer is not None:
+                writer.close()
+            raise
+
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.unlink(self.checkpoint)
+        return result
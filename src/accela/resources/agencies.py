@@ -41,6 +41,10 @@ class Agencies(BaseResource):
     This resource does not require agency or environment context.
     """
 
+    # The agency list is near-static, so allow it to be cached for a day
+    CACHE_KEY = "agencies"
+    CACHE_TTL = 24 * 60 * 60
+
     # Override to allow global access
     REQUIRES_AGENCY = False
     REQUIRES_ENVIRONMENT = False
@@ -52,6 +52,10 @@ class AgencyEnvironments(BaseResource):
     This resource does not require agency or environment context.
     """
 
+    # Environments for an agency change about as often as the agency itself
+    CACHE_KEY = "agency_environments"
+    CACHE_TTL = 24 * 60 * 60
+
     # Override to allow global access
     REQUIRES_AGENCY = False
     REQUIRES_ENVIRONMENT = False
@@ -0,0 +1,689 @@
+import asyncio
+import os
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from .agencies import Agencies
+from .agency_environments import AgencyEnvironments
+from .base import BaseResource, ListResponse, T
+from .documents import (
+    DOWNLOAD_BUFFER_SIZE,
+    DOWNLOAD_CHUNK_SIZE,
+    Document,
+    DownloadProgress,
+    DownloadResult,
+    DownloadSizeError,
+    Documents,
+    _BodyInterrupted,
+    _body_offset,
+    _document_path,
+    _DownloadMonitor,
+    _file_size,
+    _mapped_path,
+    _MappedPart,
+)
+from .modules import Modules
+from .record_addresses import RecordAddresses
+from .record_documents import RecordDocuments
+from .record_parcels import RecordParcels
+from .record_types import RecordTypes
+from .records import Record, Records, RetrieveManyResult
+from ..util.json_codec import declared_charset, utf8_body
+from ..util.json_stream import JSONArrayStream
+
+
+class AsyncListResponse(ListResponse[T]):
+    """ListResponse whose pagination is driven by an AsyncAccelaClient."""
+
+    async def auto_paging_iter(  # type: ignore[override]
+            self, concurrency: int = 1, prefetch: Optional[int] = None
+    ) -> AsyncIterator[T]:
+        """Automatically handle pagination and yield items one at a time.
+
+        Args:
+            concurrency: Number of pages to fetch in parallel, default 1 (sequential)
+            prefetch: Maximum number of pages fetched ahead of the consumer and held in memory;
+                defaults to `concurrency`. Only used when concurrency is greater than 1.
+
+        If a page still fails after the client's retries, starting a new auto_paging_iter() resumes at
+        the failed page without yielding any item twice.
+        """
+        if not self._resume:
+            for item in self.data:
+                yield item
+
+        try:
+            if concurrency > 1:
+                async for item in self._concurrent_paging_iter(concurrency, prefetch or concurrency):
+                    yield item
+                return
+
+            # Continue fetching more pages as long as there are more items
+            while self.has_more:
+                self._params["offset"] = self.offset + self.limit
+
+                items, _ = await self._resource._fetch_page(
+                    self._url, self._model_class, self._params, self._result_key
+                )
+
+                # Update this instance with new page info
+                self.data = items
+                self.offset += self.limit
+                self.has_more = len(items) == self.limit and self.offset < self.total
+
+                # Yield items from this page
+                for item in items:
+                    yield item
+        except Exception:
+            self._resume = True
+            raise
+        self._resume = False
+
+    async def _fetch_page_at(self, offset: int, semaphore: asyncio.Semaphore) -> List[T]:  # type: ignore[override]
+        params = {**self._params, "offset": offset}
+        async with semaphore:
+            items, _ = await self._resource._fetch_page(self._url, self._model_class, params, self._result_key)
+        return items
+
+    async def _concurrent_paging_iter(self, concurrency: int, prefetch: int) -> AsyncIterator[T]:
+        """Fetch the remaining pages as concurrent tasks and yield their items in offset order."""
+        offsets = self._remaining_offsets()
+        pending = deque()
+        semaphore = asyncio.Semaphore(concurrency)
+        try:
+            # Keep at most `prefetch` pages in flight or waiting to be consumed
+            for offset in offsets:
+                pending.append((offset, asyncio.ensure_future(self._fetch_page_at(offset, semaphore))))
+                if len(pending) >= max(prefetch, 1):
+                    break
+
+            while pending:
+                offset, task = pending.popleft()
+                items = await task
+
+                # Update this instance with new page info
+                self._params["offset"] = offset
+                self.data = items
+                self.offset = offset
+                self.has_more = len(items) == self.limit and self.offset + self.limit < self.total
+
+                if self.has_more:
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(
+                            (next_offset, asyncio.ensure_future(self._fetch_page_at(next_offset, semaphore)))
+                        )
+
+                for item in items:
+                    yield item
+
+                # A short page means the result set ended before the reported total
+                if not self.has_more:
+                    break
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Iterate over every item across all pages, starting with the current page."""
+        return self.auto_paging_iter()
+
+
+class AsyncBaseResource(BaseResource):
+    """Base class for resources used with an AsyncAccelaClient.
+
+    Resource methods build their URL and query parameters exactly like their sync counterparts and
+    delegate to the request helpers below, which return awaitables instead of results.
+    """
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make an async GET request to the Accela API.
+
+        Args:
+            url: The API endpoint URL
+            params: Optional query parameters
+
+        Returns:
+            The JSON response from the API
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        ttl = self._cache_ttl()
+        if ttl:
+            cache_key = self._cache_key(url, params)
+            cached = self.client.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        http_cache = self.client.http_cache
+        cached = None
+        if http_cache is not None:
+            http_cache_key = self._cache_key(url, params)
+            cached = http_cache.get(http_cache_key)
+
+        response = await self.client.request(
+            "GET", url, params=params, headers=cached.validators if cached is not None else None
+        )
+        if cached is not None and response.status_code == 304:
+            http_cache.record_hit()
+            result = self.client.json_codec.loads(cached.body)
+        else:
+            body = utf8_body(response.content, response.headers.get("Content-Type"))
+            result = self.client.json_codec.loads(body)
+            if http_cache is not None:
+                http_cache.store(http_cache_key, response.headers, body)
+
+        if ttl:
+            self.client.cache.set(cache_key, result, self.CACHE_KEY, ttl)
+        return result
+
+    async def _get_binary(
+            self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ):
+        """Make an async GET request whose body is streamed.
+
+        Args:
+            url: The API endpoint URL
+            params: Optional query parameters
+            headers: Optional headers to send in addition to the default headers, e.g. Range
+
+        Returns:
+            An httpx.Response opened in streaming mode; the caller must close it
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        return await self.client.request("GET", url, params=params, headers=headers, stream=True)
+
+    async def _retrieve_resource(self, url: str, model_class: Type[T], params: Optional[Dict[str, Any]] = None) -> T:
+        result = await self._get(url, params=params)
+        return model_class.from_json(result["result"][0], self.client)
+
+    async def _list_items(
+            self, url: str, model_class: Type[T], params: Optional[Dict[str, Any]] = None, result_key: str = "result"
+    ) -> List[T]:
+        result = await self._get(url, params=params)
+        return [model_class.from_json(item, self.client) for item in result[result_key]]
+
+    async def _fetch_page(
+            self, url: str, model_class: Type[T], params: Dict[str, Any], result_key: str = "result"
+    ) -> Tuple[List[T], int]:
+        if self._streams_json():
+            def decode(item):
+                return model_class.from_json(item, self.client)
+
+            return await self._stream_page(url, params, result_key, decode)
+
+        raw_items, total = await self._fetch_raw_page(url, params, result_key)
+        return [model_class.from_json(item, self.client) for item in raw_items], total
+
+    async def _fetch_raw_page(  # type: ignore[override]
+            self, url: str, params: Dict[str, Any], result_key: str = "result"
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        if self._streams_json():
+            return await self._stream_page(url, params, result_key)
+
+        result = await self._get(url, params=params)
+
+        # Handle case where result key is missing (empty response)
+        items = result.get(result_key, [])
+        total = result.get("total", len(items))
+        return items, total
+
+    async def _stream_page(
+            self,
+            url: str,
+            params: Dict[str, Any],
+            result_key: str,
+            decode: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Tuple[List[Any], int]:
+        """Parse a list page item by item as the body arrives, decoding each item once it is complete."""
+        items = []
+        response = await self.client.request("GET", url, params=params, stream=True)
+        parser = JSONArrayStream(result_key, declared_charset(response.headers.get("Content-Type")) or "utf-8")
+        try:
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                parsed = parser.feed(chunk)
+                items += map(decode, parsed) if decode else parsed
+            parsed = parser.close()
+            items += map(decode, parsed) if decode else parsed
+        finally:
+            await response.aclose()
+        return items, parser.meta.get("total", len(items))
+
+    async def _list_resource(
+            self, url: str, model_class: Type[T], params: Dict[str, Any], result_key: str = "result"
+    ) -> AsyncListResponse[T]:
+        limit = params.get("limit", 100)
+        offset = params.get("offset", 0)
+
+        items, total = await self._fetch_page(url, model_class, params, result_key)
+
+        return AsyncListResponse(
+            data=items,
+            has_more=len(items) == limit and offset + limit < total,
+            offset=offset,
+            limit=limit,
+            total=total,
+            _client=self.client,
+            _params=params,
+            _url=url,
+            _model_class=model_class,
+            _resource=self,
+            _result_key=result_key,
+        )
+
+    async def _make_request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if method.upper() == "GET":
+            return await self._get(url, params)
+        else:
+            raise ValueError(f"Method {method} is not currently supported")
+
+
+class AsyncAgencies(AsyncBaseResource, Agencies):
+    """Async variant of Agencies."""
+
+
+class AsyncAgencyEnvironments(AsyncBaseResource, AgencyEnvironments):
+    """Async variant of AgencyEnvironments."""
+
+
+class AsyncRecords(AsyncBaseResource, Records):
+    """Async variant of Records."""
+
+    async def crawl(  # type: ignore[override]
+            self,
+            start: Union[date, datetime],
+            end: Union[date, datetime],
+            field: str = "openedDate",  # noqa
+            workers: int = 4,
+            limit: int = 100,
+            max_window_size: int = 5000,
+            min_window_span: timedelta = timedelta(minutes=1),
+            **filters: Any,
+    ) -> AsyncIterator[Record]:
+        """
+        Crawl all records in a date range with up to `workers` windows fetched concurrently.
+
+        Windows are planned, bounded and merged as in Records.crawl(); records are yielded as they arrive,
+        once per record id, in no particular order.
+        """
+        start, end, from_arg, to_arg = self._crawl_range(start, end, field, filters)
+        semaphore = asyncio.Semaphore(max(workers, 1))
+
+        async def list_window(
+                window: Tuple[datetime, datetime], page_limit: int, offset: int = 0
+        ) -> "AsyncListResponse[Record]":
+            bounds = {from_arg: window[0], to_arg: window[1]}
+            return await self.list(limit=page_limit, offset=offset, **bounds, **filters)
+
+        async def probe_total(window: Tuple[datetime, datetime]):
+            async with semaphore:
+                return window, (await list_window(window, 1)).total
+
+        async def probe(parent, windows: List[Tuple[datetime, datetime]]):
+            return parent, list(await asyncio.gather(*(probe_total(window) for window in windows)))
+
+        results: asyncio.Queue = asyncio.Queue(maxsize=max(workers, 1) * 2)
+
+        async def crawl_window(window: Tuple[datetime, datetime]) -> None:
+            try:
+                offset = 0
+                while True:
+                    async with semaphore:
+                        records = (await list_window(window, limit, offset)).data
+                    await results.put(("records", records))
+                    if len(records) < limit:
+                        break
+                    offset += limit
+                await results.put(("done", None))
+            except Exception as e:
+                await results.put(("error", e))
+
+        initial = self._initial_crawl_windows(start, end, workers)
+        pending = {asyncio.ensure_future(probe(None, [window])) for window in initial}
+        tasks: List[asyncio.Future] = []
+        try:
+            sized = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    parent, probed = task.result()
+                    for split in self._size_crawl_windows(parent, probed, max_window_size, min_window_span, sized):
+                        pending.add(asyncio.ensure_future(probe(*split)))
+
+            windows = self._merge_crawl_windows(sized, max_window_size)
+            tasks = [asyncio.ensure_future(crawl_window(window)) for window in windows]
+            seen = set()
+            remaining = len(tasks)
+            while remaining:
+                kind, payload = await results.get()
+                if kind == "error":
+                    raise payload
+                if kind == "done":
+                    remaining -= 1
+                    continue
+                for record in payload:
+                    # Windows do not overlap, but a record whose date changes mid-crawl can move into another one
+                    if record.id not in seen:
+                        seen.add(record.id)
+                        yield record
+        finally:
+            for task in [*pending, *tasks]:
+                task.cancel()
+
+    async def _list_all(self, resource_name: str, record_id: str, limit: int) -> List[Any]:  # type: ignore[override]
+        page = await getattr(self.client, resource_name).list(record_id, limit=limit)
+        return [item async for item in page.auto_paging_iter()]
+
+    async def hydrate(  # type: ignore[override]
+            self,
+            records: Union[Iterable[Record], AsyncIterable[Record]],
+            expand: Iterable[str] = ("addresses", "parcels", "documents"),
+            concurrency: int = 8,
+            limit: int = 100,
+    ) -> AsyncIterator[Record]:
+        """
+        Attach sub-resources to records with up to `concurrency` sub-resource lists in flight.
+
+        `records` may be a list or an async iterator such as auto_paging_iter(); hydrated records are
+        yielded in the order they were given. See Records.hydrate().
+        """
+        resource_names = self._expansions(expand)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        window = max(concurrency, 1) * 2
+
+        async def list_all(resource_name: str, record_id: str) -> List[Any]:
+            async with semaphore:
+                return await self._list_all(resource_name, record_id, limit)
+
+        async def attach(record: Record, tasks: List[asyncio.Future]) -> Record:
+            for name, task in zip(resource_names, tasks):
+                setattr(record, name, await task)
+            return record
+
+        async def source() -> AsyncIterator[Record]:
+            if hasattr(records, "__aiter__"):
+                async for record in records:
+                    yield record
+            else:
+                for record in records:
+                    yield record
+
+        pending = deque()
+        try:
+            async for record in source():
+                tasks = [asyncio.ensure_future(list_all(name, record.id)) for name in resource_names]
+                pending.append((record, tasks))
+                if len(pending) >= window:
+                    yield await attach(*pending.popleft())
+            while pending:
+                yield await attach(*pending.popleft())
+        finally:
+            for _, tasks in pending:
+                for task in tasks:
+                    task.cancel()
+
+    async def _retrieve_chunk(  # type: ignore[override]
+            self, chunk: List[str], fields: Optional[List[str]] = None
+    ) -> Dict[str, Record]:
+        import httpx
+
+        url = f"{self.client.BASE_URL}/records/{','.join(chunk)}"
+        try:
+            result = await self._get(url, params=self._fields_param(fields))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return {}
+            raise
+        records = (Record.from_json(item, self.client) for item in result.get("result") or [])
+        return {record.id: record for record in records}
+
+    async def retrieve_many(  # type: ignore[override]
+            self,
+            ids: Iterable[str],
+            chunk_size: int = Records.RETRIEVE_CHUNK_SIZE,
+            concurrency: int = 4,
+            fields: Optional[List[str]] = None,
+    ) -> RetrieveManyResult:
+        """
+        Retrieve many records by ID, several per request, with up to `concurrency` requests in flight.
+
+        Returns:
+            RetrieveManyResult with the records in the order of `ids` and the IDs that were not found
+        """
+        unique_ids, chunks = self._chunk_ids(ids, chunk_size)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def retrieve_chunk(chunk: List[str]) -> Dict[str, Record]:
+            async with semaphore:
+                return await self._retrieve_chunk(chunk, fields)
+
+        found: Dict[str, Record] = {}
+        for records in await asyncio.gather(*(retrieve_chunk(chunk) for chunk in chunks)):
+            found.update(records)
+        return self._ordered_result(unique_ids, found)
+
+
+class AsyncRecordAddresses(AsyncBaseResource, RecordAddresses):
+    """Async variant of RecordAddresses."""
+
+
+class AsyncRecordDocuments(AsyncBaseResource, RecordDocuments):
+    """Async variant of RecordDocuments."""
+
+
+class AsyncRecordParcels(AsyncBaseResource, RecordParcels):
+    """Async variant of RecordParcels."""
+
+
+class AsyncDocuments(AsyncBaseResource, Documents):
+    """Async variant of Documents."""
+
+    async def download(self, document_id: int):
+        """
+        Download a document's binary content as a stream.
+
+        Args:
+            document_id: The ID of the document to download
+
+        Returns:
+            httpx.Response opened in streaming mode. Iterate response.aiter_bytes() and close it when done.
+
+        Example:
+            response = await client.documents.download("12345")
+            try:
+                with open("document.pdf", "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        f.write(chunk)
+            finally:
+                await response.aclose()
+        """
+        url = f"{self.client.BASE_URL}/documents/{document_id}/download"
+        return await self._get_binary(url)
+
+    async def _download_to(  # type: ignore[override]
+            self,
+            document: Union[int, str, Document],
+            dest_dir: str,
+            monitor: _DownloadMonitor,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> DownloadResult:
+        import httpx
+
+        if not isinstance(document, Document):
+            document = await self.retrieve(document)
+        path = _document_path(dest_dir, document)
+        expected = document.size
+        if expected is not None and os.path.isfile(path) and _file_size(path) == expected:
+            monitor.finished(document.id, expected)
+            return DownloadResult(document.id, path, expected, resumed_from=expected)
+        store = self.client.document_store
+        if store is not None:
+            size = store.copy_to(document, path)
+            if size is not None:
+                monitor.finished(document.id, size)
+                return DownloadResult(document.id, path, size, resumed_from=size, from_store=True)
+
+        url = f"{self.client.BASE_URL}/documents/{document.id}/download"
+        part_path = f"{path}.part"
+        if os.path.exists(_mapped_path(part_path)):
+            os.unlink(_mapped_path(part_path))
+        resumed_from = None
+        retry = 0
+        started = time.monotonic()
+        while True:
+            offset = _file_size(part_path)
+            if expected is not None and offset > expected:
+                os.unlink(part_path)
+                offset = 0
+            if resumed_from is None:
+                resumed_from = offset
+            try:
+                if expected is None or offset < expected:
+                    start, offset = await self._stream_to(url, part_path, offset, document, monitor, buffer_size)
+                    resumed_from = min(resumed_from, start)
+                if expected is not None and offset != expected:
+                    raise DownloadSizeError(part_path, expected, offset)
+            except (_BodyInterrupted, DownloadSizeError) as e:
+                if isinstance(e, _BodyInterrupted):
+                    resumed_from = min(resumed_from, e.start)
+                policy = self.client.retry_policy
+                delay = policy.next_delay("GET", retry, time.monotonic() - started) if policy is not None else None
+                if delay is None:
+                    if isinstance(e, _BodyInterrupted):
+                        raise e.__cause__ from None
+                    raise
+                retry += 1
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        os.replace(part_path, path)
+        if store is not None:
+            store.put(document, path)
+        monitor.finished(document.id, offset)
+        return DownloadResult(document.id, path, offset, resumed_from=resumed_from)
+
+    async def _stream_to(  # type: ignore[override]
+            self,
+            url: str,
+            part_path: str,
+            offset: int,
+            document: Document,
+            monitor: _DownloadMonitor,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> Tuple[int, int]:
+        import httpx
+
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        try:
+            response = await self._get_binary(url, headers=headers)
+        except httpx.HTTPStatusError as e:
+            if offset and e.response.status_code == 416:
+                os.unlink(part_path)
+                return await self._stream_to(url, part_path, 0, document, monitor, buffer_size)
+            raise
+        try:
+            start = _body_offset(response.status_code, response.headers, offset)
+            if start is None:
+                await response.aclose()
+                os.unlink(part_path)
+                return await self._stream_to(url, part_path, 0, document, monitor, buffer_size)
+            try:
+                if document.size:
+                    written = await self._copy_into_mapped(response, part_path, start, document, monitor, buffer_size)
+                else:
+                    with open(part_path, "r+b" if start else "wb") as f:
+                        f.seek(start)
+                        f.truncate()
+                        written = start
+                        async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            written += len(chunk)
+                            monitor.chunk(document.id, written, document.size, len(chunk))
+            except httpx.TransportError as e:
+                raise _BodyInterrupted(start) from e
+        finally:
+            await response.aclose()
+        return start, written
+
+    @staticmethod
+    async def _copy_into_mapped(
+            response,
+            part_path: str,
+            start: int,
+            document: Document,
+            monitor: _DownloadMonitor,
+            buffer_size: int,
+    ) -> int:
+        """Copy a response body into the partial file preallocated to the document's size and memory-mapped.
+
+        httpx cannot read into a caller's buffer, so each chunk of up to `buffer_size` bytes still arrives
+        as a bytes object and is copied into the mapping. The file is preallocated and resumed like the
+        sync client's, but the CPU time stays about that of writing the chunks to a file.
+        """
+        size = document.size
+        with _MappedPart(part_path, start, size) as part:
+            async for chunk in response.aiter_bytes(chunk_size=buffer_size):
+                end = part.written + len(chunk)
+                if end > size:
+                    received = end
+                    break
+                part.view[part.written:end] = chunk
+                part.written = end
+                monitor.chunk(document.id, end, size, len(chunk))
+            else:
+                received = part.written
+        if received > size:
+            # Longer than the API said; a retry starts over rather than trusting this file
+            os.unlink(part_path)
+            raise DownloadSizeError(part_path, size, received)
+        return part.written
+
+    async def download_many(  # type: ignore[override]
+            self,
+            documents: Iterable[Union[int, str, Document]],
+            dest_dir: Union[str, os.PathLike],
+            concurrency: int = 4,
+            progress: Optional[Callable[[DownloadProgress], None]] = None,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> List[DownloadResult]:
+        """
+        Download many documents into a directory with up to `concurrency` downloads in flight.
+
+        Partial files are resumed and verified, and documents of known size are written into a
+        preallocated memory-mapped file, as in Documents.download_many(). httpx hands the body over in
+        bytes chunks of up to `buffer_size`, which are copied into the mapping, so unlike the sync client
+        this does not cut CPU time. If a download fails, the first error is raised once the other
+        downloads have finished.
+
+        Returns:
+            A DownloadResult per document, in the order given
+        """
+        dest_dir = os.fspath(dest_dir)
+        documents = list(documents)
+        os.makedirs(dest_dir, exist_ok=True)
+        monitor = _DownloadMonitor(len(documents), progress)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def download(document: Union[int, str, Document]) -> DownloadResult:
+            async with semaphore:
+                return await self._download_to(document, dest_dir, monitor, buffer_size)
+
+        results = await asyncio.gather(*(download(document) for document in documents), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+
+class AsyncModules(AsyncBaseResource, Modules):
+    """Async variant of Modules."""
+
+
+class AsyncRecordTypes(AsyncBaseResource, RecordTypes):
+    """Async variant of RecordTypes."""
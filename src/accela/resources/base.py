@@ -1,44 +1,109 @@
 import json
 import re
 from abc import ABC
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, asdict, dataclass, field, fields, make_dataclass
 from datetime import datetime
-from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from zoneinfo import ZoneInfo
 
 import requests
 
+from ..util.columns import ColumnBuilder, ColumnTable
+from ..util.json_codec import declared_charset, get_default_codec, utf8_body
+from ..util.json_stream import JSONArrayStream
+
 T = TypeVar("T")
 
+_CAMEL_CASE_BOUNDARY = re.compile("([a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=8192)
+def _camel_to_snake(name: str) -> str:
+    # Insert underscore before uppercase letters that follow lowercase letters
+    return _CAMEL_CASE_BOUNDARY.sub(r"\1_\2", name).lower()
+
+
+def _convert_keys_to_snake_case(obj: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
+    if isinstance(obj, dict):
+        return {_camel_to_snake(key): _convert_keys_to_snake_case(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [_convert_keys_to_snake_case(item) for item in obj]
+    else:
+        return obj
+
+
+class _LazyField:
+    """Non-data descriptor that decodes a field from raw_json on first access and memoizes it on the instance."""
+
+    def __init__(self, name: str, api_field: str, decode: Callable[[Any, Optional[ZoneInfo]], Any], default: Any):
+        self.name = name
+        self.api_field = api_field
+        self.decode = decode
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.default
+        state = instance.__dict__
+        raw = state.get("raw_json") or {}
+        value = self.decode(raw[self.api_field], state.get("_timezone")) if self.api_field in raw else self.default
+        # Storing the value in the instance dict means later reads bypass this descriptor entirely
+        state[self.name] = value
+        return value
+
+
+def _new_lazy_model(model_class):
+    return object.__new__(model_class._lazy_class())
+
+
+def _reduce_lazy_model(self):
+    return _new_lazy_model, (type(self)._model_class,), dict(self.__dict__)
+
+
+def _model_eq(self, other):
+    """Equality for lazy and compact models: equal to any instance of the same model with equal field values."""
+    model_class = type(self)._model_class
+    if not isinstance(other, model_class):
+        return NotImplemented
+    return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(model_class) if f.compare)
+
+
+def _new_compact_model(model_class, values):
+    return model_class._compact_class()(**values)
+
+
+def _reduce_compact_model(self):
+    values = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+    return _new_compact_model, (type(self)._model_class, values)
+
 
 class ResourceModel(ABC):
     """Abstract base class for Accela API models with common functionality."""
 
+    # Slotted so compact models built on this class have no instance __dict__; _client is the client that
+    # decoded the model, whose json_codec to_json() uses, and is left unset on models built directly
+    __slots__ = ("_client",)
+
     FIELD_MAPPING: Dict[str, str]  # Required mapping of {"apiField": "python_field"}
     # Optional field type mapping
     DICT_FIELDS: List[str] = []  # API fields containing objects that need snake_case key conversion
     DATETIME_FIELDS: List[str] = []  # API fields that should be parsed as datetime objects
     BOOL_FIELDS: List[str] = []  # API fields that contain 'Y'/'N' strings to convert to boolean
+    # Python fields filled in after decoding, e.g. by Records.hydrate(); left out of to_dict() and exports while None
+    ATTACHED_FIELDS: List[str] = []
 
     @classmethod
     def _camel_to_snake(cls, name: str) -> str:
         """Convert camelCase to snake_case."""
-        # Insert underscore before uppercase letters that follow lowercase letters
-        s1 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
-        return s1.lower()
+        return _camel_to_snake(name)
 
     @classmethod
     def _convert_keys_to_snake_case(cls, obj: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
         """Recursively convert all dictionary keys from camelCase to snake_case."""
-        if isinstance(obj, dict):
-            return {
-                cls._camel_to_snake(key): cls._convert_keys_to_snake_case(value)
-                for key, value in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [cls._convert_keys_to_snake_case(item) for item in obj]
-        else:
-            return obj
+        return _convert_keys_to_snake_case(obj)
 
     @classmethod
     def _parse_bool(cls, bool_str: str) -> bool:
@@ -63,62 +128,281 @@ class ResourceModel(ABC):
         Returns:
             datetime object, naive or timezone-aware based on timezone parameter
         """
-        # Parse the datetime string
-        dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        # fromisoformat is much faster than strptime and equivalent for strings in exactly this layout
+        if (
+                len(date_str) == 19
+                and date_str[4] == "-"
+                and date_str[7] == "-"
+                and date_str[10] == " "
+                and date_str[13] == ":"
+                and date_str[16] == ":"
+                and date_str.isascii()
+        ):
+            dt = datetime.fromisoformat(date_str)
+        else:
+            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
         if timezone:
             dt = dt.replace(tzinfo=timezone)
         return dt
 
     @classmethod
-    def from_json(cls, data: Dict[str, Any], client=None):
-        """Generic method to create instance from API response data."""
-        kwargs = {}
+    def _lazy_field_names(cls) -> Dict[str, str]:
+        """API fields that lazy models decode on first access, mapped to their Python field names.
+
+        Nested objects and datetimes are deferred; required fields are always decoded eagerly.
+        """
+        optional = {f.name for f in fields(cls) if f.default is not MISSING or f.default_factory is not MISSING}
+        deferred = set(cls.DICT_FIELDS) | set(cls.DATETIME_FIELDS)
+        return {
+            api_field: python_field
+            for api_field, python_field in cls.FIELD_MAPPING.items()
+            if api_field in deferred and python_field in optional
+        }
+
+    @classmethod
+    def _lazy_class(cls) -> type:
+        """Return the subclass used for lazy instances of this model, creating it on first use."""
+        lazy_class = cls.__dict__.get("_lazy_model_class")
+        if lazy_class is None:
+            dict_fields = set(cls.DICT_FIELDS)
+            convert_keys = cls._convert_keys_to_snake_case
+            parse_datetime = cls._parse_datetime
+            defaults = {f.name: f.default for f in fields(cls)}
+
+            def decode_dict(value, timezone):
+                return convert_keys(value)
+
+            def decode_datetime(value, timezone):
+                if value is not None and isinstance(value, str):
+                    return parse_datetime(value, timezone)
+                return value
+
+            namespace = {
+                "__doc__": f"{cls.__name__} that decodes nested objects and datetimes on first access.",
+                "__reduce__": _reduce_lazy_model,
+                "__eq__": _model_eq,
+                "_model_class": cls,
+            }
+            for api_field, python_field in cls._lazy_field_names().items():
+                decode = decode_dict if api_field in dict_fields else decode_datetime
+                namespace[python_field] = _LazyField(python_field, api_field, decode, defaults[python_field])
+
+            lazy_class = type(f"Lazy{cls.__name__}", (cls,), namespace)
+            cls._lazy_model_class = lazy_class
+        return lazy_class
+
+    @classmethod
+    def _compact_class(cls) -> type:
+        """Return the slotted class used for compact instances of this model, creating it on first use.
 
+        A model dataclass carries an instance __dict__, which a subclass cannot drop, so the compact class is
+        a slotted copy of the model built directly on ResourceModel: it has the model's fields and mapping
+        constants and is registered as a virtual subclass, so isinstance(instance, cls) holds. Instances have
+        no __dict__, and setting an attribute that is not a field raises AttributeError.
+        """
+        compact_class = cls.__dict__.get("_compact_model_class")
+        if compact_class is None:
+            model_fields = fields(cls)
+            names = {f.name for f in model_fields}
+            namespace = {
+                "__doc__": f"{cls.__name__} that stores its fields in slots.",
+                "__reduce__": _reduce_compact_model,
+                "__eq__": _model_eq,
+                "_model_class": cls,
+            }
+            # Class constants such as FIELD_MAPPING, nearest definition first
+            for klass in cls.__mro__:
+                if klass is ResourceModel:
+                    break
+                for name, value in vars(klass).items():
+                    if not name.startswith("_") and name not in names and not callable(value):
+                        namespace.setdefault(name, value)
+            compact_class = make_dataclass(
+                f"Compact{cls.__name__}",
+                [
+                    (f.name, f.type, field(
+                        default=f.default, default_factory=f.default_factory, init=f.init, repr=f.repr,
+                        compare=f.compare, metadata=f.metadata,
+                    ))
+                    for f in model_fields
+                ],
+                bases=(ResourceModel,),
+                namespace=namespace,
+                slots=True,
+            )
+            compact_class.__module__ = cls.__module__
+            cls.register(compact_class)
+            cls._compact_model_class = compact_class
+        return compact_class
+
+    @classmethod
+    def _compile_decoder(
+            cls, lazy: bool = False, compact: bool = False, keep_raw_json: bool = True
+    ) -> Callable[[Dict[str, Any], Optional[ZoneInfo]], Any]:
+        """Generate a decoder specialized to this model's field mapping and field types.
+
+        The generated function performs the same per-field conversions as a walk over FIELD_MAPPING
+        checking DICT_FIELDS, DATETIME_FIELDS and BOOL_FIELDS, with the dispatch resolved up front.
+        Lazy decoders skip the fields from _lazy_field_names and build an instance of _lazy_class instead;
+        compact decoders build an instance of _compact_class.
+        """
+        if lazy and (compact or not keep_raw_json):
+            raise ValueError("Lazy models decode from raw_json and need an instance dict; they cannot be compact")
+
+        dict_fields = set(cls.DICT_FIELDS)
+        datetime_fields = set(cls.DATETIME_FIELDS)
+        bool_fields = set(cls.BOOL_FIELDS)
+        lazy_fields = cls._lazy_field_names() if lazy else {}
+
+        lines = ["def decode(data, timezone):", "    kwargs = {}"]
         for api_field, python_field in cls.FIELD_MAPPING.items():
-            if api_field in data:
-                value = data[api_field]
-
-                # Apply recursive snake_case conversion for dictionary object fields
-                if api_field in cls.DICT_FIELDS:
-                    value = cls._convert_keys_to_snake_case(value)
-
-                # Parse datetime fields
-                elif (
-                        api_field in cls.DATETIME_FIELDS
-                        and value is not None
-                        and isinstance(value, str)
-                ):
-                    timezone = client.timezone if client else None
-                    value = cls._parse_datetime(value, timezone)
-
-                # Parse boolean fields
-                elif (
-                        api_field in cls.BOOL_FIELDS
-                        and value is not None
-                        and isinstance(value, str)
-                ):
-                    value = cls._parse_bool(value)
-
-                kwargs[python_field] = value
-
-        instance = cls(**kwargs)  # type: ignore
-        instance.raw_json = data
-        return instance
+            if api_field in lazy_fields:
+                continue
+            lines.append(f"    if {api_field!r} in data:")
+            if api_field in dict_fields:
+                lines.append(f"        kwargs[{python_field!r}] = convert_keys(data[{api_field!r}])")
+            elif api_field in datetime_fields or api_field in bool_fields:
+                parse = "parse_datetime(value, timezone)" if api_field in datetime_fields else "parse_bool(value)"
+                lines += [
+                    f"        value = data[{api_field!r}]",
+                    "        if value is not None and isinstance(value, str):",
+                    f"            value = {parse}",
+                    f"        kwargs[{python_field!r}] = value",
+                ]
+            else:
+                lines.append(f"        kwargs[{python_field!r}] = data[{api_field!r}]")
+
+        namespace = {
+            "cls": cls._compact_class() if compact else cls,
+            "convert_keys": cls._convert_keys_to_snake_case,
+            "parse_datetime": cls._parse_datetime,
+            "parse_bool": cls._parse_bool,
+        }
+
+        if not lazy:
+            lines.append("    instance = cls(**kwargs)")
+            if keep_raw_json:
+                lines.append("    instance.raw_json = data")
+            lines.append("    return instance")
+        else:
+            # Bypass __init__ so the deferred fields stay out of the instance dict until they are read
+            lazy_names = set(lazy_fields.values())
+            eager = [f for f in fields(cls) if f.name not in lazy_names and f.name != "raw_json"]
+            namespace["lazy_class"] = cls._lazy_class()
+            namespace["defaults"] = {f.name: f.default for f in eager if f.default is not MISSING}
+            for f in eager:
+                if f.default is MISSING and f.default_factory is MISSING:
+                    lines += [
+                        f"    if {f.name!r} not in kwargs:",
+                        f"        raise TypeError({cls.__name__ + '.__init__() missing required argument: ' + repr(f.name)!r})",
+                    ]
+                elif f.default_factory is not MISSING:
+                    namespace[f"factory_{f.name}"] = f.default_factory
+                    lines += [
+                        f"    if {f.name!r} not in kwargs:",
+                        f"        kwargs[{f.name!r}] = factory_{f.name}()",
+                    ]
+            lines += [
+                "    instance = object.__new__(lazy_class)",
+                "    state = instance.__dict__",
+                "    state.update(defaults)",
+                "    state.update(kwargs)",
+                "    state['raw_json'] = data",
+                "    state['_timezone'] = timezone",
+                "    return instance",
+            ]
+
+        exec(compile("\n".join(lines), f"<{cls.__name__} decoder>", "exec"), namespace)
+        return namespace["decode"]
+
+    @classmethod
+    def _decoder(
+            cls, lazy: bool = False, compact: bool = False, keep_raw_json: bool = True
+    ) -> Callable[[Dict[str, Any], Optional[ZoneInfo]], Any]:
+        """Return this class's compiled decoder for a model mode, generating it on first use."""
+        # Look in the class's own namespace so subclasses never reuse a parent's decoders
+        decoders = cls.__dict__.get("_compiled_decoders")
+        if decoders is None:
+            decoders = {}
+            cls._compiled_decoders = decoders
+        mode = (lazy, compact, keep_raw_json)
+        decoder = decoders.get(mode)
+        if decoder is None:
+            decoder = cls._compile_decoder(lazy=lazy, compact=compact, keep_raw_json=keep_raw_json)
+            decoders[mode] = decoder
+        return decoder
+
+    @classmethod
+    def api_fields(cls, names: Iterable[str]) -> List[str]:
+        """API field names for a `fields` projection, always including the fields the model requires.
+
+        Args:
+            names: Python field names such as "status_date", or API field names such as "statusDate"
+
+        Returns:
+            API field names, required ones (e.g. "id") first, without duplicates
+        """
+        to_api = {python_field: api_field for api_field, python_field in cls.FIELD_MAPPING.items()}
+        required = [
+            to_api[f.name] for f in fields(cls)
+            if f.default is MISSING and f.default_factory is MISSING and f.name in to_api
+        ]
+        return list(dict.fromkeys(required + [to_api.get(name, name) for name in names]))
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any], client=None):
+        """Generic method to create instance from API response data.
+
+        The client's model options select the representation: lazy_models decodes nested objects and
+        datetimes on first read, compact_models stores fields in slots, and keep_raw_json=False leaves
+        raw_json empty so the response dict can be freed.
+
+        Payloads projected with a `fields` parameter decode to partial models: only the fields present
+        are converted, and the others keep their defaults (None).
+
+        Any object can be passed as the client: options it does not have take their defaults, so stubs
+        and other client-like objects carrying only a timezone keep working.
+        """
+        if client:
+            decoder = cls._decoder(
+                getattr(client, "lazy_models", False),
+                getattr(client, "compact_models", False),
+                getattr(client, "keep_raw_json", True),
+            )
+            instance = decoder(data, getattr(client, "timezone", None))
+            instance._client = client
+            return instance
+        return cls._decoder()(data, None)
 
     def to_dict(self) -> Dict[str, Any]:
         result = {}
         for key, value in asdict(self).items():  # noqa
-            if key != "raw_json":
-                result[key] = value
+            if key == "raw_json":
+                continue
+            if key in self.ATTACHED_FIELDS:
+                attached = getattr(self, key)
+                if attached is None:
+                    continue
+                value = [item.to_dict() for item in attached]
+            result[key] = value
         return result
 
     def to_json(self, pretty: bool = False) -> str:
-        indent = 2 if pretty else None
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        """Serialize to_dict() with the json_codec of the client that decoded this model, or the default codec.
+
+        Codecs agree on values but not on whitespace: the stdlib codec writes {"id": 1}, orjson and ujson
+        write {"id":1}.
+        """
+        codec = getattr(getattr(self, "_client", None), "json_codec", None) or get_default_codec()
+        return codec.dumps(self.to_dict(), pretty=pretty)
 
     def __str__(self) -> str:
         return self.to_json(pretty=False)
 
+    def __getstate__(self):
+        # The client holds an HTTP session, so pickles and copies of a model leave it behind
+        return dict(self.__dict__)
+
 
 @dataclass
 class ListResponse(Generic[T]):
@@ -133,37 +417,150 @@ class ListResponse(Generic[T]):
     _params: Dict[str, Any] = field(default_factory=dict)
     _url: str = None
     _model_class: Type[T] = None
+    _resource: Any = None
+    _result_key: str = "result"
+    # Set when paging fails, so that iterating again resumes at the failed page instead of the first one
+    _resume: bool = False
+    # Items of the failed page already yielded before a streamed body broke off
+    _resume_skip: int = 0
 
-    def auto_paging_iter(self) -> Iterator[T]:
-        """Automatically handle pagination and yield items one at a time."""
-        yield from self.data
+    def auto_paging_iter(self, concurrency: int = 1, prefetch: Optional[int] = None) -> "PageIterator[T]":
+        """Automatically handle pagination and yield items one at a time.
 
-        # Continue fetching more pages as long as there are more items
+        The returned iterator can instead collect the remaining pages into typed columns with
+        `.columns(fields=[...])`, which never builds model instances for those pages.
+
+        Requests are retried according to the client's retry policy. If a page still fails, the error
+        propagates from next(); calling next() again, or starting a new auto_paging_iter(), resumes at
+        the failed page without yielding any item twice.
+
+        Args:
+            concurrency: Number of pages to fetch in parallel, default 1 (sequential)
+            prefetch: Maximum number of pages fetched ahead of the consumer and held in memory;
+                defaults to `concurrency`. Only used when concurrency is greater than 1.
+        """
+        return PageIterator(self, concurrency, prefetch)
+
+    def _iter_items(self, concurrency: int, prefetch: Optional[int]) -> Iterator[T]:
+        if not self._resume:
+            yield from self.data
+        try:
+            if concurrency <= 1 and self._resource._streams_json():
+                yield from self._streaming_items()
+                return
+            for items in self._iter_pages(concurrency, prefetch):
+                yield from items
+        except Exception:
+            self._resume = True
+            raise
+        self._resume = False
+
+    def _streaming_items(self) -> Iterator[T]:
+        """Sequential pagination that yields each item as soon as it is parsed from the response body."""
+        resource = self._resource
         while self.has_more:
             self._params["offset"] = self.offset + self.limit
 
-            response = requests.get(
-                self._url, headers=self._client.headers, params=self._params
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            # Handle case where result key is missing (empty response)
-            if "result" not in result:
-                items = []
-            else:
-                items = [
-                    self._model_class.from_json(item, self._client)
-                    for item in result["result"]
-                ]
+            meta = {}
+            items = []
+            try:
+                for raw_item in resource._stream_raw_items(self._url, self._params, self._result_key, meta):
+                    items.append(self._model_class.from_json(raw_item, resource.client))
+                    if len(items) > self._resume_skip:
+                        yield items[-1]
+            except Exception:
+                self._resume_skip = max(self._resume_skip, len(items))
+                raise
+            self._resume_skip = 0
 
             # Update this instance with new page info
             self.data = items
             self.offset += self.limit
             self.has_more = len(items) == self.limit and self.offset < self.total
 
-            # Yield items from this page
-            yield from items
+    def _iter_pages(self, concurrency: int, prefetch: Optional[int], raw: bool = False) -> Iterator[List[Any]]:
+        """Yield the items of each remaining page; raw pages hold the undecoded API items."""
+        if concurrency > 1:
+            yield from self._concurrent_pages(concurrency, prefetch or concurrency, raw)
+            return
+
+        # Continue fetching more pages as long as there are more items
+        while self.has_more:
+            self._params["offset"] = self.offset + self.limit
+
+            items = self._fetch_page_at(self._params["offset"], raw)
+
+            # Update this instance with new page info
+            if not raw:
+                self.data = items
+            self.offset += self.limit
+            self.has_more = len(items) == self.limit and self.offset < self.total
+
+            yield items
+
+    def _remaining_offsets(self) -> Iterator[int]:
+        """Offsets of the pages left to fetch, based on the total reported by the first page."""
+        if not self.has_more:
+            return iter(())
+        return iter(range(self.offset + self.limit, self.total, self.limit))
+
+    def _fetch_page_at(self, offset: int, raw: bool = False) -> List[Any]:
+        params = {**self._params, "offset": offset}
+        if raw:
+            items, _ = self._resource._fetch_raw_page(self._url, params, self._result_key)
+        else:
+            items, _ = self._resource._fetch_page(self._url, self._model_class, params, self._result_key)
+        return items
+
+    def _concurrent_pages(self, concurrency: int, prefetch: int, raw: bool = False) -> Iterator[List[Any]]:
+        """Fetch the remaining pages on a bounded thread pool and yield them in offset order."""
+        offsets = self._remaining_offsets()
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="accela-page")
+        try:
+            # Keep at most `prefetch` pages in flight or waiting to be consumed
+            for offset in offsets:
+                pending.append((offset, executor.submit(self._fetch_page_at, offset, raw)))
+                if len(pending) >= max(prefetch, 1):
+                    break
+
+            while pending:
+                offset, future = pending.popleft()
+                items = future.result()
+
+                # Update this instance with new page info
+                self._params["offset"] = offset
+                if not raw:
+                    self.data = items
+                self.offset = offset
+                self.has_more = len(items) == self.limit and self.offset + self.limit < self.total
+
+                if self.has_more:
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append((next_offset, executor.submit(self._fetch_page_at, next_offset, raw)))
+
+                yield items
+
+                # A short page means the result set ended before the reported total
+                if not self.has_more:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def to_columns(self, fields: Sequence[str]) -> ColumnTable:
+        """Collect fields of the items in this page into typed, array-backed columns.
+
+        Args:
+            fields: Python field names, e.g. ["balance", "status", "opened_date"]
+
+        Returns:
+            ColumnTable mapping each field name to its column
+        """
+        builder = ColumnBuilder(self._model_class, fields, self._client.timezone if self._client else None)
+        for item in self.data:
+            builder.append_model(item)
+        return builder.build()
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.data)
@@ -181,13 +578,72 @@ class ListResponse(Generic[T]):
         }
 
     def to_json(self, pretty: bool = False) -> str:
-        indent = 2 if pretty else None
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        codec = self._client.json_codec if self._client is not None else get_default_codec()
+        return codec.dumps(self.to_dict(), pretty=pretty)
 
     def __str__(self) -> str:
         return f"ListResponse(total={self.total}, offset={self.offset}, limit={self.limit}, has_more={self.has_more})"
 
 
+class PageIterator(Iterator[T]):
+    """Iterator over every item of a paginated list, returned by ListResponse.auto_paging_iter()."""
+
+    def __init__(self, list_response: ListResponse[T], concurrency: int = 1, prefetch: Optional[int] = None):
+        self._list_response = list_response
+        self._concurrency = concurrency
+        self._prefetch = prefetch
+        self._items: Optional[Iterator[T]] = None
+
+    def __iter__(self) -> "PageIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._items is None:
+            self._items = self._list_response._iter_items(self._concurrency, self._prefetch)
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise
+        except Exception:
+            # A generator that raised is finished; the next call starts another, which resumes at the failed page
+            self._items = None
+            raise
+
+    def close(self) -> None:
+        """Stop iterating and release any pages being fetched ahead."""
+        if self._items is not None:
+            self._items.close()
+
+    def columns(self, fields: Sequence[str]) -> ColumnTable:
+        """Collect fields of every item into typed, array-backed columns instead of yielding models.
+
+        Pages after the first are accumulated straight from the API's JSON, without building a model
+        per item. Floats become float64 arrays with NaN for null, datetimes int64 epoch seconds,
+        and strings and value objects such as status are dictionary-encoded.
+
+        Args:
+            fields: Python field names, e.g. ["balance", "total_fee", "status", "opened_date"]
+
+        Returns:
+            ColumnTable mapping each field name to its column
+
+        Raises:
+            RuntimeError: If items have already been consumed from this iterator
+        """
+        if self._items is not None:
+            raise RuntimeError("columns() must be called before iterating")
+
+        list_response = self._list_response
+        builder = ColumnBuilder(
+            list_response._model_class, fields, list_response._client.timezone if list_response._client else None
+        )
+        for item in list_response.data:
+            builder.append_model(item)
+        for items in list_response._iter_pages(self._concurrency, self._prefetch, raw=True):
+            builder.extend_raw(items)
+        return builder.build()
+
+
 class BaseResource:
     """Base class for all Accela API resources."""
     
@@ -196,6 +652,14 @@ class BaseResource:
     REQUIRES_AGENCY = True
     REQUIRES_ENVIRONMENT = True
 
+    # Override in subclasses to cache responses in the client's ResponseCache
+    # CACHE_KEY names the resource for per-resource TTLs and invalidation; CACHE_TTL is the default TTL in seconds
+    CACHE_KEY: Optional[str] = None
+    CACHE_TTL: Optional[float] = None
+
+    # Bytes read from the socket at a time when the client streams JSON
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, client):
         """Initialize the resource with an AccelaClient instance."""
         self.client = client
@@ -229,18 +693,61 @@ class BaseResource:
         Raises:
             requests.HTTPError: If the request fails
         """
-        response = requests.get(url, headers=self.client.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        ttl = self._cache_ttl()
+        if ttl:
+            cache_key = self._cache_key(url, params)
+            cached = self.client.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        http_cache = self.client.http_cache
+        cached = None
+        if http_cache is not None:
+            http_cache_key = self._cache_key(url, params)
+            cached = http_cache.get(http_cache_key)
+
+        response = self.client.request(
+            "GET", url, params=params, headers=cached.validators if cached is not None else None
+        )
+        if cached is not None and response.status_code == 304:
+            http_cache.record_hit()
+            result = self.client.json_codec.loads(cached.body)
+        else:
+            body = utf8_body(response.content, response.headers.get("Content-Type"))
+            result = self.client.json_codec.loads(body)
+            if http_cache is not None:
+                http_cache.store(http_cache_key, response.headers, body)
+
+        if ttl:
+            self.client.cache.set(cache_key, result, self.CACHE_KEY, ttl)
+        return result
+
+    def _cache_ttl(self) -> Optional[float]:
+        """TTL for this resource's responses, or None if they should not be cached."""
+        if self.CACHE_KEY is None or self.client.cache is None:
+            return None
+        return self.client.cache.ttl_for(self.CACHE_KEY, self.CACHE_TTL)
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for a request, scoped to the client's agency and environment."""
+        return json.dumps(
+            [self.client.agency, self.client.environment, url, sorted((params or {}).items())], default=str
+        )
 
     def _get_binary(
-            self, url: str, params: Optional[Dict[str, Any]] = None
+            self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            stream: bool = False,
     ) -> requests.Response:
         """Make a GET request that returns binary content.
 
         Args:
             url: The API endpoint URL
             params: Optional query parameters
+            headers: Optional headers to send in addition to the default headers, e.g. Range
+            stream: Whether to defer downloading the body until it is read
 
         Returns:
             The raw Response object for binary content access
@@ -248,9 +755,117 @@ class BaseResource:
         Raises:
             requests.HTTPError: If the request fails
         """
-        response = requests.get(url, headers=self.client.headers, params=params)
-        response.raise_for_status()
-        return response
+        return self.client.request("GET", url, params=params, headers=headers, stream=stream)
+
+    def _retrieve_resource(self, url: str, model_class: Type[T], params: Optional[Dict[str, Any]] = None) -> T:
+        """Generic method to retrieve a single resource.
+
+        Args:
+            url: The API endpoint URL
+            model_class: The model class to use for parsing the result
+            params: Optional query parameters
+
+        Returns:
+            Model instance built from the first item of the response's result array
+        """
+        result = self._get(url, params=params)
+        return model_class.from_json(result["result"][0], self.client)
+
+    def _list_items(
+            self, url: str, model_class: Type[T], params: Optional[Dict[str, Any]] = None, result_key: str = "result"
+    ) -> List[T]:
+        """Generic method to list resources from an endpoint without pagination.
+
+        Args:
+            url: The API endpoint URL
+            model_class: The model class to use for parsing results
+            params: Optional query parameters
+            result_key: The key in the response that contains the results array
+
+        Returns:
+            List of model instances
+        """
+        result = self._get(url, params=params)
+        return [model_class.from_json(item, self.client) for item in result[result_key]]
+
+    def _fetch_page(
+            self, url: str, model_class: Type[T], params: Dict[str, Any], result_key: str = "result"
+    ) -> Tuple[List[T], int]:
+        """Fetch and parse a single page of a list endpoint.
+
+        Args:
+            url: The API endpoint URL
+            model_class: The model class to use for parsing results
+            params: Query parameters including limit and offset
+            result_key: The key in the response that contains the results array
+
+        Returns:
+            Tuple of the parsed items and the total reported by the API
+        """
+        if self._streams_json():
+            # Decode each item as it is parsed so the raw page is never held in full
+            meta = {}
+            raw_items = self._stream_raw_items(url, params, result_key, meta)
+            items = [model_class.from_json(item, self.client) for item in raw_items]
+            return items, meta.get("total", len(items))
+
+        raw_items, total = self._fetch_raw_page(url, params, result_key)
+        # Parse the results into model instances
+        return [model_class.from_json(item, self.client) for item in raw_items], total
+
+    def _fetch_raw_page(
+            self, url: str, params: Dict[str, Any], result_key: str = "result"
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch a single page of a list endpoint without decoding its items.
+
+        Args:
+            url: The API endpoint URL
+            params: Query parameters including limit and offset
+            result_key: The key in the response that contains the results array
+
+        Returns:
+            Tuple of the raw items and the total reported by the API
+        """
+        if self._streams_json():
+            meta = {}
+            items = list(self._stream_raw_items(url, params, result_key, meta))
+            return items, meta.get("total", len(items))
+
+        result = self._get(url, params=params)
+
+        # Handle case where result key is missing (empty response)
+        items = result.get(result_key, [])
+        total = result.get("total", len(items))
+        return items, total
+
+    def _streams_json(self) -> bool:
+        """Whether list pages are parsed incrementally; cached settings resources always use _get."""
+        return self.client.stream_json and not self._cache_ttl()
+
+    def _stream_raw_items(
+            self, url: str, params: Dict[str, Any], result_key: str, meta: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the raw items of a list page as they are parsed from the response body.
+
+        Args:
+            url: The API endpoint URL
+            params: Query parameters including limit and offset
+            result_key: The key in the response that contains the results array
+            meta: Dict that receives the response's other top-level members, such as total,
+                once the body has been read
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        response = self.client.request("GET", url, params=params, stream=True)
+        parser = JSONArrayStream(result_key, declared_charset(response.headers.get("Content-Type")) or "utf-8")
+        try:
+            for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        finally:
+            response.close()
+        meta.update(parser.meta)
 
     def _list_resource(self, url: str, model_class: Type[T], params: Dict[str, Any], result_key: str = "result") -> \
     ListResponse[T]:
@@ -268,15 +883,7 @@ class BaseResource:
         limit = params.get("limit", 100)
         offset = params.get("offset", 0)
 
-        result = self._get(url, params=params)
-
-        # Parse the results into model instances
-        # Handle case where result key is missing (empty response)
-        if result_key not in result:
-            items = []
-        else:
-            items = [model_class.from_json(item, self.client) for item in result[result_key]]
-        total = result.get("total", len(items))
+        items, total = self._fetch_page(url, model_class, params, result_key)
 
         return ListResponse(
             data=items,
@@ -288,6 +895,8 @@ class BaseResource:
             _params=params,
             _url=url,
             _model_class=model_class,
+            _resource=self,
+            _result_key=result_key,
         )  # Type will be inferred as ListResponse[model_class]
 
     def _make_request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
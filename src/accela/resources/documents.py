@@ -1,8 +1,14 @@
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import requests
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 
 from .base import BaseResource, ResourceModel
 
@@ -77,6 +83,172 @@ class Document(ResourceModel):
     ]
 
 
+@dataclass
+class DownloadResult:
+    """A document saved by Documents.download_many()."""
+
+    document_id: int
+    path: str
+    size: int
+    # Bytes already on disk or in the document store that were not fetched again
+    resumed_from: int = 0
+    # Whether the document was copied from the client's document store instead of downloaded
+    from_store: bool = False
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of a Documents.download_many() call, reported each time a chunk is written."""
+
+    document_id: int
+    downloaded: int
+    size: Optional[int]
+    total_downloaded: int
+    bytes_per_second: float
+    completed: int
+    total: int
+
+
+class DownloadSizeError(Exception):
+    """Raised when a downloaded document does not have the size the API reported for it."""
+
+    def __init__(self, path: str, expected: int, actual: int):
+        super().__init__(f"Downloaded {actual} bytes to {path!r}, expected {expected}")
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+
+class _BodyInterrupted(Exception):
+    """A download response's body broke off; the partial file keeps what arrived after `start`."""
+
+    def __init__(self, start: int):
+        super().__init__(f"Download body broke off after writing from byte {start}")
+        self.start = start
+
+
+# Bytes read from a download response at a time when the document's size is unknown
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Bytes read straight into a memory-mapped file per call when the document's size is known
+DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _document_path(dest_dir: str, document: Document) -> str:
+    """Final path of a downloaded document: its ID followed by its file name, which may come from the agency."""
+    name = os.path.basename(document.file_name or "") or "document"
+    return os.path.join(dest_dir, f"{document.id}-{name}")
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _mapped_path(part_path: str) -> str:
+    """Name a partial file has while it is preallocated and memory-mapped."""
+    return f"{part_path}.mapped"
+
+
+class _MappedPart:
+    """A partial file preallocated to the document's size and memory-mapped for the duration of a with block.
+
+    The body is written through `view` and `written` advanced past it. On exit the mapping is flushed and
+    the file truncated to `written`, so an interrupted download is resumed from there. While preallocated,
+    the file is named "<part>.mapped", and only goes back to the partial file's name once it is flushed,
+    truncated and synced: a process killed meanwhile leaves no partial file whose length overstates what
+    arrived, and the next download discards the mapped file.
+    """
+
+    def __init__(self, part_path: str, start: int, size: int):
+        self.part_path = part_path
+        self.mapped_path = _mapped_path(part_path)
+        self.start = start
+        self.size = size
+        self.written = start
+
+    def __enter__(self) -> "_MappedPart":
+        if self.start:
+            os.replace(self.part_path, self.mapped_path)
+        self._file = open(self.mapped_path, "r+b" if self.start else "w+b")
+        try:
+            self._file.truncate(self.size)
+            self._mapped = mmap.mmap(self._file.fileno(), self.size)
+        except BaseException:
+            self._close_file()
+            raise
+        self.view = memoryview(self._mapped)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.view.release()
+            self._mapped.flush()
+            self._mapped.close()
+        finally:
+            self._close_file()
+
+    def _close_file(self) -> None:
+        try:
+            self._file.truncate(self.written)
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            os.replace(self.mapped_path, self.part_path)
+
+
+def _body_offset(status_code: int, headers: Mapping[str, str], offset: int) -> Optional[int]:
+    """Position in the file at which a download response's body starts, or None if it cannot be used.
+
+    A 206 continues the partial file at the requested offset; a 200 means the server ignored the
+    Range header and is sending the whole document again.
+    """
+    if status_code != 206:
+        return 0
+    content_range = headers.get("Content-Range") or ""
+    if content_range.startswith(f"bytes {offset}-"):
+        return offset
+    return None
+
+
+class _DownloadMonitor:
+    """Counts the bytes and documents a download_many() call has written and reports them to a callback."""
+
+    def __init__(self, total: int, callback: Optional[Callable[[DownloadProgress], None]]):
+        self.total = total
+        self.callback = callback
+        self.total_downloaded = 0
+        self.completed = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _report(self, document_id: int, downloaded: int, size: Optional[int]) -> None:
+        if self.callback is None:
+            return
+        elapsed = time.monotonic() - self._started
+        self.callback(DownloadProgress(
+            document_id=document_id,
+            downloaded=downloaded,
+            size=size,
+            total_downloaded=self.total_downloaded,
+            bytes_per_second=self.total_downloaded / elapsed if elapsed > 0 else 0.0,
+            completed=self.completed,
+            total=self.total,
+        ))
+
+    def chunk(self, document_id: int, downloaded: int, size: Optional[int], received: int) -> None:
+        with self._lock:
+            self.total_downloaded += received
+            self._report(document_id, downloaded, size)
+
+    def finished(self, document_id: int, size: int) -> None:
+        with self._lock:
+            self.completed += 1
+            self._report(document_id, size, size)
+
+
 class Documents(BaseResource):
     """Resource for interacting with Accela documents."""
 
@@ -91,8 +263,7 @@ class Documents(BaseResource):
             Document object
         """
         url = f"{self.client.BASE_URL}/documents/{document_id}"
-        result = self._get(url)
-        return Document.from_json(result["result"][0], self.client)
+        return self._retrieve_resource(url, Document)
 
     def download(self, document_id: int) -> requests.Response:
         """
@@ -112,4 +283,214 @@ class Documents(BaseResource):
                     f.write(chunk)
         """
         url = f"{self.client.BASE_URL}/documents/{document_id}/download"
-        return self._get_binary(url)
+        return self._get_binary(url, stream=True)
+
+    def _download_to(
+            self,
+            document: Union[int, str, Document],
+            dest_dir: str,
+            monitor: _DownloadMonitor,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> DownloadResult:
+        """Download one document into dest_dir through a partial file, resuming it if one was left behind."""
+        if not isinstance(document, Document):
+            document = self.retrieve(document)
+        path = _document_path(dest_dir, document)
+        expected = document.size
+        if expected is not None and os.path.isfile(path) and _file_size(path) == expected:
+            monitor.finished(document.id, expected)
+            return DownloadResult(document.id, path, expected, resumed_from=expected)
+        store = self.client.document_store
+        if store is not None:
+            size = store.copy_to(document, path)
+            if size is not None:
+                monitor.finished(document.id, size)
+                return DownloadResult(document.id, path, size, resumed_from=size, from_store=True)
+
+        url = f"{self.client.BASE_URL}/documents/{document.id}/download"
+        part_path = f"{path}.part"
+        if os.path.exists(_mapped_path(part_path)):
+            # Left by a process killed while the file was mapped; its length says nothing about its content
+            os.unlink(_mapped_path(part_path))
+        resumed_from = None
+        retry = 0
+        started = time.monotonic()
+        while True:
+            offset = _file_size(part_path)
+            if expected is not None and offset > expected:
+                os.unlink(part_path)
+                offset = 0
+            if resumed_from is None:
+                resumed_from = offset
+            try:
+                if expected is None or offset < expected:
+                    start, offset = self._stream_to(url, part_path, offset, document, monitor, buffer_size)
+                    resumed_from = min(resumed_from, start)
+                if expected is not None and offset != expected:
+                    raise DownloadSizeError(part_path, expected, offset)
+            except (_BodyInterrupted, DownloadSizeError) as e:
+                # The client already retried requests that failed before a response; only bodies that broke
+                # off or came up short are resumed here, asking for what the partial file is missing
+                if isinstance(e, _BodyInterrupted):
+                    resumed_from = min(resumed_from, e.start)
+                policy = self.client.retry_policy
+                delay = policy.next_delay("GET", retry, time.monotonic() - started) if policy is not None else None
+                if delay is None:
+                    if isinstance(e, _BodyInterrupted):
+                        raise e.__cause__ from None
+                    raise
+                retry += 1
+                time.sleep(delay)
+                continue
+            break
+
+        os.replace(part_path, path)
+        if store is not None:
+            store.put(document, path)
+        monitor.finished(document.id, offset)
+        return DownloadResult(document.id, path, offset, resumed_from=resumed_from)
+
+    def _stream_to(
+            self,
+            url: str,
+            part_path: str,
+            offset: int,
+            document: Document,
+            monitor: _DownloadMonitor,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> Tuple[int, int]:
+        """Append a download to the partial file from `offset`.
+
+        Returns:
+            The position the body was written from, 0 when the server sent the whole document again,
+            and the partial file's size afterwards
+
+        Raises:
+            _BodyInterrupted: If the body broke off after the response arrived
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        try:
+            response = self._get_binary(url, headers=headers, stream=True)
+        except requests.HTTPError as e:
+            if offset and e.response is not None and e.response.status_code == 416:
+                # The partial file is no prefix of the document; start over
+                os.unlink(part_path)
+                return self._stream_to(url, part_path, 0, document, monitor, buffer_size)
+            raise
+        with response:
+            start = _body_offset(response.status_code, response.headers, offset)
+            if start is None:
+                response.close()
+                os.unlink(part_path)
+                return self._stream_to(url, part_path, 0, document, monitor, buffer_size)
+            try:
+                if document.size:
+                    written = self._read_into_mapped(response, part_path, start, document, monitor, buffer_size)
+                else:
+                    with open(part_path, "r+b" if start else "wb") as f:
+                        f.seek(start)
+                        f.truncate()
+                        written = start
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            written += len(chunk)
+                            monitor.chunk(document.id, written, document.size, len(chunk))
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                raise _BodyInterrupted(start) from e
+        return start, written
+
+    def _read_into_mapped(
+            self,
+            response: requests.Response,
+            part_path: str,
+            start: int,
+            document: Document,
+            monitor: _DownloadMonitor,
+            buffer_size: int,
+    ) -> int:
+        """Read a response body into the partial file preallocated to the document's size and memory-mapped.
+
+        Each read fills up to `buffer_size` bytes of the mapping in place, so no bytes object is allocated
+        per chunk and no write call copies it again.
+        """
+        size = document.size
+        # requests decodes gzip / deflate bodies in iter_content(); reading raw, urllib3 has to do it
+        response.raw.decode_content = True
+        with _MappedPart(part_path, start, size) as part:
+            try:
+                while part.written < size:
+                    buffer = part.view[part.written:part.written + buffer_size]
+                    try:
+                        received = response.raw.readinto(buffer)
+                    finally:
+                        # A traceback may still reference the slice, which would keep the mapping open
+                        buffer.release()
+                    if not received:
+                        break
+                    part.written += received
+                    monitor.chunk(document.id, part.written, size, received)
+            except ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+            except ReadTimeoutError as e:
+                raise requests.ConnectionError(e)
+        if part.written == size and response.raw.read(1):
+            # Longer than the API said; a retry starts over rather than trusting this file
+            os.unlink(part_path)
+            raise DownloadSizeError(part_path, size, size + 1)
+        return part.written
+
+    def download_many(
+            self,
+            documents: Iterable[Union[int, str, Document]],
+            dest_dir: Union[str, os.PathLike],
+            concurrency: int = 4,
+            progress: Optional[Callable[[DownloadProgress], None]] = None,
+            buffer_size: int = DOWNLOAD_BUFFER_SIZE,
+    ) -> List[DownloadResult]:
+        """
+        Download many documents into a directory, several at a time.
+
+        Each document is saved as "<id>-<file name>". It is streamed into "<path>.part" and renamed into
+        place once its size matches the document's size, so a file at the final path is always complete.
+        A partial file left by an interrupted download is resumed with an HTTP Range request; if the
+        server sends the whole document instead, it is downloaded again from the start. Connection
+        drops mid-body are resumed the same way, following the client's retry policy. Documents whose
+        complete file already exists are not downloaded again.
+
+        With a client document_store, a document whose modified date and size match the stored copy is
+        copied from the store instead, and every downloaded document is added to it. Pass Document objects
+        rather than IDs to skip the metadata request as well.
+
+        If a download still fails, its partial file is kept and the first error is raised once the other
+        downloads have finished, so calling download_many() again picks up where it stopped.
+
+        When the document's size is known, its partial file is preallocated to that size and memory-mapped,
+        and the body is read straight into the mapping `buffer_size` bytes at a time. This keeps CPU and
+        allocations low for large files such as plan sets. Documents of unknown size are streamed in chunks.
+
+        Args:
+            documents: Document IDs, or Document objects to save retrieving each document's metadata
+            dest_dir: Directory to save the documents in, created if it does not exist
+            concurrency: Number of documents downloading at once, default 4
+            progress: Called with a DownloadProgress after every chunk written and every document completed,
+                from the downloading threads; carries the call's throughput in bytes per second
+            buffer_size: Bytes read into a memory-mapped file per call, default 4 MiB. On an interrupted
+                connection, the bytes of the read in progress are fetched again.
+
+        Returns:
+            A DownloadResult per document, in the order given
+
+        Raises:
+            DownloadSizeError: If a document's size still does not match after the client's retries
+            requests.HTTPError: If a request fails
+        """
+        dest_dir = os.fspath(dest_dir)
+        documents = list(documents)
+        os.makedirs(dest_dir, exist_ok=True)
+        monitor = _DownloadMonitor(len(documents), progress)
+        if len(documents) <= 1 or concurrency <= 1:
+            return [self._download_to(document, dest_dir, monitor, buffer_size) for document in documents]
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="accela-download") as executor:
+            return list(executor.map(
+                lambda document: self._download_to(document, dest_dir, monitor, buffer_size), documents
+            ))
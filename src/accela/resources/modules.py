@@ -28,6 +28,10 @@ class Module(ResourceModel):
 class Modules(BaseResource):
     """Modules resource for interacting with Accela settings/modules API."""
 
+    # Module settings rarely change; cached for a day when the client has a ResponseCache
+    CACHE_KEY = "modules"
+    CACHE_TTL = 24 * 60 * 60
+
     def list(self) -> List[Module]:
         """
         List all available modules.
@@ -36,5 +40,4 @@ class Modules(BaseResource):
             List of Module objects
         """
         url = f"{self.client.BASE_URL}/settings/modules"
-        result = self._get(url)
-        return [Module.from_json(item, self.client) for item in result["result"]]
+        return self._list_items(url, Module)
@@ -169,6 +169,6 @@ class RecordAddresses(BaseResource):
             params["isPrimary"] = is_primary
 
         if fields is not None and len(fields) > 0:
-            params["fields"] = ",".join(fields)
+            params["fields"] = ",".join(RecordAddress.api_fields(fields))
 
         return self._list_resource(url, RecordAddress, params)
@@ -66,6 +66,10 @@ class RecordType(ResourceModel):
 class RecordTypes(BaseResource):
     """Record types resource for interacting with Accela settings/records/types API."""
 
+    # Cached for a day when the client has a ResponseCache
+    CACHE_KEY = "record_types"
+    CACHE_TTL = 24 * 60 * 60
+
     def list(self, *, module: str, limit: int = 100, offset: int = 0) -> ListResponse[RecordType]:
         """
         List record types for a specific module with pagination support.
@@ -1,8 +1,17 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import requests
 
 from .base import BaseResource, ListResponse, ResourceModel
+from .documents import Document
+from .record_addresses import RecordAddress
+from .record_parcels import RecordParcel
 
 
 @dataclass
@@ -89,6 +98,11 @@ class Record(ResourceModel):
     update_date: Optional[datetime] = None
     value: Optional[str] = None
 
+    # Sub-resources attached by Records.hydrate(); None until hydrated
+    record_addresses: Optional[List[RecordAddress]] = field(default=None, repr=False)
+    record_parcels: Optional[List[RecordParcel]] = field(default=None, repr=False)
+    record_documents: Optional[List[Document]] = field(default=None, repr=False)
+
     FIELD_MAPPING = {
         "actualProductionUnit": "actual_production_unit",
         "addresses": "addresses",
@@ -214,10 +228,37 @@ class Record(ResourceModel):
         "publicOwned",
     ]
 
+    ATTACHED_FIELDS = ["record_addresses", "record_parcels", "record_documents"]
+
+
+@dataclass
+class RetrieveManyResult:
+    """Records fetched by Records.retrieve_many(), in the order their ids were requested."""
+
+    records: List[Record] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
 
 class Records(BaseResource):
     """Records resource for interacting with Accela records API."""
 
+    # Date fields that can be crawled, mapped to the list() range filter arguments for that field
+    CRAWL_FIELDS = {
+        "openedDate": ("opened_date_from", "opened_date_to"),
+        "assignedDate": ("assigned_date_from", "assigned_date_to"),
+        "completedDate": ("completed_date_from", "completed_date_to"),
+        "statusDate": ("status_date_from", "status_date_to"),
+        "closedDate": ("closed_date_from", "closed_date_to"),
+    }
+    # Accela dates are whole seconds, so crawl windows are whole seconds with inclusive bounds
+    CRAWL_RESOLUTION = timedelta(seconds=1)
+
     def list(
             self,
             limit: int = 100,
@@ -243,6 +284,7 @@ class Records(BaseResource):
             closed_by_department: Optional[str] = None,
             closed_by_user: Optional[str] = None,
             record_class: Optional[str] = None,
+            fields: Optional[List[str]] = None,
     ) -> ListResponse[Record]:
         """
         List records with pagination support and various filters.
@@ -271,6 +313,8 @@ class Records(BaseResource):
             closed_by_department: Filter by the department which closed the application
             closed_by_user: Filter by the user who closed the application
             record_class: Filter by record class
+            fields: Fields to return, e.g. ["status", "status_date"]; the id is always included and the
+                other fields of the returned records are None
 
         Returns:
             ListResponse object with pagination support
@@ -321,18 +365,349 @@ class Records(BaseResource):
             if value is not None:
                 params[key] = value
 
+        if fields:
+            params["fields"] = ",".join(Record.api_fields(fields))
+
         return self._list_resource(url, Record, params)
 
-    def retrieve(self, record_id: str) -> Record:
+    def retrieve(self, record_id: str, fields: Optional[List[str]] = None) -> Record:
         """
         Retrieve a specific record by ID.
 
         Args:
             record_id: The ID of the record to retrieve
+            fields: Fields to return; the id is always included and the record's other fields are None
 
         Returns:
             Record object
         """
         url = f"{self.client.BASE_URL}/records/{record_id}"
-        result = self._get(url)
-        return Record.from_json(result["result"][0], self.client)
+        return self._retrieve_resource(url, Record, params=self._fields_param(fields))
+
+    @staticmethod
+    def _fields_param(fields: Optional[List[str]]) -> Optional[Dict[str, str]]:
+        return {"fields": ",".join(Record.api_fields(fields))} if fields else None
+
+    # Sub-resources hydrate() can attach, mapped to the client resource listing them; the Record field has the same name
+    EXPANSIONS = {
+        "addresses": "record_addresses",
+        "parcels": "record_parcels",
+        "documents": "record_documents",
+    }
+
+    def _expansions(self, expand: Iterable[str]) -> List[str]:
+        names = list(dict.fromkeys(expand))
+        unknown = [name for name in names if name not in self.EXPANSIONS]
+        if unknown:
+            raise ValueError(f"Cannot expand {', '.join(unknown)}; expected any of {', '.join(self.EXPANSIONS)}")
+        return [self.EXPANSIONS[name] for name in names]
+
+    def _list_all(self, resource_name: str, record_id: str, limit: int) -> List[Any]:
+        """Every item of a record's sub-resource, following its pagination."""
+        return list(getattr(self.client, resource_name).list(record_id, limit=limit).auto_paging_iter())
+
+    def hydrate(
+            self,
+            records: Iterable[Record],
+            expand: Iterable[str] = ("addresses", "parcels", "documents"),
+            concurrency: int = 8,
+            limit: int = 100,
+    ) -> Iterator[Record]:
+        """
+        Attach sub-resources to records, fetching them concurrently.
+
+        Each record's addresses, parcels and documents are listed in parallel with those of the records
+        around it, and every sub-list is paged through in full. The results are set on the record's
+        record_addresses, record_parcels and record_documents fields. Records are consumed lazily, so
+        `records` can be an auto_paging_iter() over millions of records.
+
+        Args:
+            records: Records to hydrate, e.g. a page or client.records.list(...).auto_paging_iter()
+            expand: Sub-resources to attach; any of "addresses", "parcels" and "documents", default all three
+            concurrency: Number of sub-resource requests in flight at once, default 8
+            limit: Page size for the sub-resource lists, default 100
+
+        Returns:
+            Iterator of the same Record objects, hydrated, in the order they were given
+        """
+        resource_names = self._expansions(expand)
+        # Records whose sub-resources are being fetched ahead of the consumer
+        window = max(concurrency, 1) * 2
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="accela-hydrate")
+        try:
+            for record in records:
+                futures = [executor.submit(self._list_all, name, record.id, limit) for name in resource_names]
+                pending.append((record, futures))
+                if len(pending) >= window:
+                    yield self._attach(*pending.popleft(), resource_names)
+            while pending:
+                yield self._attach(*pending.popleft(), resource_names)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _attach(record: Record, futures: List[Any], resource_names: List[str]) -> Record:
+        for name, future in zip(resource_names, futures):
+            setattr(record, name, future.result())
+        return record
+
+    # Records per request in retrieve_many(); keeps the comma-separated path well under URL length limits
+    RETRIEVE_CHUNK_SIZE = 50
+
+    @staticmethod
+    def _chunk_ids(ids: Iterable[str], chunk_size: int) -> Tuple[List[str], List[List[str]]]:
+        """Deduplicate ids in order and split them into chunks of at most chunk_size."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        unique_ids = list(dict.fromkeys(ids))
+        return unique_ids, [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+
+    @staticmethod
+    def _ordered_result(unique_ids: Sequence[str], found: Dict[str, Record]) -> RetrieveManyResult:
+        return RetrieveManyResult(
+            records=[found[record_id] for record_id in unique_ids if record_id in found],
+            missing=[record_id for record_id in unique_ids if record_id not in found],
+        )
+
+    def _retrieve_chunk(self, chunk: List[str], fields: Optional[List[str]] = None) -> Dict[str, Record]:
+        url = f"{self.client.BASE_URL}/records/{','.join(chunk)}"
+        try:
+            result = self._get(url, params=self._fields_param(fields))
+        except requests.HTTPError as e:
+            # The API answers 404 when none of the ids exist
+            if e.response is not None and e.response.status_code == 404:
+                return {}
+            raise
+        records = (Record.from_json(item, self.client) for item in result.get("result") or [])
+        return {record.id: record for record in records}
+
+    def retrieve_many(
+            self,
+            ids: Iterable[str],
+            chunk_size: int = RETRIEVE_CHUNK_SIZE,
+            concurrency: int = 4,
+            fields: Optional[List[str]] = None,
+    ) -> RetrieveManyResult:
+        """
+        Retrieve many records by ID, several per request.
+
+        IDs are sent as comma-separated chunks, and the chunks are fetched in parallel.
+
+        Args:
+            ids: The IDs of the records to retrieve; repeated IDs are fetched and returned once
+            chunk_size: Number of IDs per request, default 50
+            concurrency: Number of requests in flight at once, default 4
+            fields: Fields to return; the id is always included and the records' other fields are None
+
+        Returns:
+            RetrieveManyResult with the records in the order of `ids` and the IDs that were not found
+        """
+        unique_ids, chunks = self._chunk_ids(ids, chunk_size)
+        found: Dict[str, Record] = {}
+        if len(chunks) <= 1 or concurrency <= 1:
+            for chunk in chunks:
+                found.update(self._retrieve_chunk(chunk, fields))
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="accela-retrieve") as executor:
+                for records in executor.map(lambda chunk: self._retrieve_chunk(chunk, fields), chunks):
+                    found.update(records)
+        return self._ordered_result(unique_ids, found)
+
+    def crawl(
+            self,
+            start: Union[date, datetime],
+            end: Union[date, datetime],
+            field: str = "openedDate",  # noqa
+            workers: int = 4,
+            limit: int = 100,
+            max_window_size: int = 5000,
+            min_window_span: timedelta = timedelta(minutes=1),
+            **filters: Any,
+    ) -> Iterator[Record]:
+        """
+        Crawl all records in a date range by splitting it into windows that are fetched concurrently.
+
+        The range is split into time windows on `field`. Each window's reported total is used to split
+        windows holding more than `max_window_size` records and to merge adjacent windows that together
+        hold fewer, so no window needs deep offset pagination. Windows are then paged through in parallel
+        and records are yielded as they arrive, once per record id.
+
+        Windows start and end on whole seconds and include both bounds; each window starts one second after
+        the previous one ends, so a record on a boundary falls in exactly one window. A window is not split
+        into halves shorter than `min_window_span`, and is not split at all if its halves report more records
+        between them than it did, which means the server caps totals; such windows are paged sequentially.
+
+        Args:
+            start: Start of the date range
+            end: End of the date range
+            field: Date field to slice on; one of CRAWL_FIELDS, default "openedDate"
+            workers: Number of windows fetched in parallel, default 4
+            limit: Number of records per page, default 100
+            max_window_size: Largest number of records a window may hold before it is split, default 5000
+            min_window_span: Windows are never split below this span, at least one second, default one minute
+            **filters: Any other list() filter, e.g. module or type
+
+        Returns:
+            Iterator of deduplicated Record objects, in no particular order
+        """
+        start, end, from_arg, to_arg = self._crawl_range(start, end, field, filters)
+
+        def list_window(window: Tuple[datetime, datetime], page_limit: int, offset: int = 0) -> ListResponse[Record]:
+            return self.list(limit=page_limit, offset=offset, **{from_arg: window[0], to_arg: window[1]}, **filters)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="accela-crawl")
+        try:
+            windows = self._plan_crawl_windows(
+                executor, list_window, start, end, workers, max_window_size, min_window_span
+            )
+            yield from self._crawl_windows(executor, list_window, windows, workers, limit)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _crawl_range(
+            self, start: Union[date, datetime], end: Union[date, datetime], field: str, filters: Dict[str, Any]  # noqa
+    ) -> Tuple[datetime, datetime, str, str]:
+        """Validate crawl() arguments, returning the range as datetimes and the list() arguments bounding it."""
+        if field not in self.CRAWL_FIELDS:
+            raise ValueError(f"Cannot crawl on {field}; expected one of {', '.join(self.CRAWL_FIELDS)}")
+        from_arg, to_arg = self.CRAWL_FIELDS[field]
+        if from_arg in filters or to_arg in filters:
+            raise ValueError(f"{from_arg}/{to_arg} are set by crawl() from start and end")
+
+        start, end = self._as_datetime(start), self._as_datetime(end)
+        if start >= end:
+            raise ValueError("start must be before end")
+        return start.replace(microsecond=0), end.replace(microsecond=0), from_arg, to_arg
+
+    @staticmethod
+    def _as_datetime(value: Union[date, datetime]) -> datetime:
+        if isinstance(value, datetime):
+            return value
+        return datetime.combine(value, datetime.min.time())
+
+    @staticmethod
+    def _plan_crawl_windows(executor, list_window, start, end, workers, max_window_size, min_window_span):
+        """Split [start, end] into windows sized by their reported totals."""
+
+        def probe(parent, windows):
+            return parent, [(window, list_window(window, 1).total) for window in windows]
+
+        initial = Records._initial_crawl_windows(start, end, workers)
+        pending = {executor.submit(probe, None, [window]) for window in initial}
+        sized = []
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                parent, probed = future.result()
+                for split in Records._size_crawl_windows(parent, probed, max_window_size, min_window_span, sized):
+                    pending.add(executor.submit(probe, *split))
+        return Records._merge_crawl_windows(sized, max_window_size)
+
+    @staticmethod
+    def _initial_crawl_windows(start: datetime, end: datetime, workers: int) -> List[Tuple[datetime, datetime]]:
+        """Split [start, end] evenly into up to one window per worker, on whole seconds."""
+        step = Records.CRAWL_RESOLUTION
+        seconds = (end - start) // step + 1
+        count = max(min(workers, seconds), 1)
+        bounds = [start + step * (seconds * i // count) for i in range(count + 1)]
+        return [(bounds[i], bounds[i + 1] - step) for i in range(count)]
+
+    @staticmethod
+    def _halve_crawl_window(window, min_window_span: timedelta):
+        """Split a window into two on a whole second, or return None if a half would be shorter than min_window_span."""
+        step = Records.CRAWL_RESOLUTION
+        window_start, window_end = window
+        half = ((window_end - window_start) // step + 1) // 2
+        if step * half < max(min_window_span, step):
+            return None
+        middle = window_start + step * half
+        return (window_start, middle - step), (middle, window_end)
+
+    @staticmethod
+    def _size_crawl_windows(parent, probed, max_window_size: int, min_window_span: timedelta, sized) -> List[Any]:
+        """
+        Sort probed (window, total) pairs into sized and return the (parent, halves) still to probe.
+
+        parent is the (window, total) the probed windows were halved from, or None for an initial window.
+        Halves that report more records together than their parent mean the server caps totals, so splitting
+        cannot size the window any further and the parent is kept to be paged through sequentially.
+        """
+        if parent is not None and sum(total for _, total in probed) > parent[1]:
+            sized.append(parent)
+            return []
+        splits = []
+        for window, total in probed:
+            halves = Records._halve_crawl_window(window, min_window_span) if total > max_window_size else None
+            if halves:
+                splits.append(((window, total), halves))
+            elif total > 0:
+                sized.append((window, total))
+        return splits
+
+    @staticmethod
+    def _merge_crawl_windows(sized, max_window_size: int) -> List[Tuple[datetime, datetime]]:
+        """Merge adjacent (window, total) pairs while they stay within max_window_size."""
+        sized = sorted(sized, key=lambda item: item[0][0])
+        merged = []
+        for window, total in sized:
+            adjacent = merged and merged[-1][0][1] + Records.CRAWL_RESOLUTION == window[0]
+            if adjacent and merged[-1][1] + total <= max_window_size:
+                previous, previous_total = merged.pop()
+                merged.append(((previous[0], window[1]), previous_total + total))
+            else:
+                merged.append((window, total))
+        return [window for window, _ in merged]
+
+    @staticmethod
+    def _crawl_windows(executor, list_window, windows, workers, limit) -> Iterator[Record]:
+        """
+        Page through windows on the executor and yield their records once per id.
+
+        Each window is paged until a short page rather than up to its reported total, which may be capped.
+        """
+        results: queue.Queue = queue.Queue(maxsize=max(workers, 1) * 2)
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def crawl_window(window) -> None:
+            try:
+                offset = 0
+                while not stop.is_set():
+                    records = list_window(window, limit, offset).data
+                    put(("records", records))
+                    if len(records) < limit:
+                        break
+                    offset += limit
+                put(("done", None))
+            except Exception as e:
+                put(("error", e))
+
+        for window in windows:
+            executor.submit(crawl_window, window)
+
+        seen = set()
+        remaining = len(windows)
+        try:
+            while remaining:
+                kind, payload = results.get()
+                if kind == "error":
+                    raise payload
+                if kind == "done":
+                    remaining -= 1
+                    continue
+                for record in payload:
+                    # Windows do not overlap, but a record whose date changes mid-crawl can move into another one
+                    if record.id not in seen:
+                        seen.add(record.id)
+                        yield record
+        finally:
+            stop.set()
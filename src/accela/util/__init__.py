@@ -1,6 +1,35 @@
-from .access_token import AccelaAccessToken, get_access_token
+from .access_token import AccelaAccessToken, TokenProvider, get_access_token, refresh_access_token
+from .cache import ResponseCache
+from .columns import ColumnTable
+from .document_store import DocumentStore
+from .http_cache import HTTPCache
+from .json_codec import JSONCodec, get_codec, set_default_codec
+from .rate_limit import AdaptiveConcurrency, RateLimiter
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .session import ConnectionStats
+from .token_cache import FileTokenCache
+from .watermarks import FileWatermarkStore, SQLiteWatermarkStore, WatermarkStore
 
 __all__ = [
     "AccelaAccessToken",
+    "AdaptiveConcurrency",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ColumnTable",
+    "ConnectionStats",
+    "DocumentStore",
+    "FileTokenCache",
+    "FileWatermarkStore",
+    "HTTPCache",
+    "JSONCodec",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteWatermarkStore",
+    "TokenProvider",
+    "WatermarkStore",
     "get_access_token",
+    "get_codec",
+    "refresh_access_token",
+    "set_default_codec",
 ]
@@ -1,8 +1,16 @@
+import asyncio
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import requests
 
+if TYPE_CHECKING:
+    from .token_cache import FileTokenCache
+
+TOKEN_URL = "https://apis.accela.com/oauth2/token"
+
 
 @dataclass(kw_only=True)
 class AccelaAccessToken:
@@ -23,10 +31,34 @@ def get_access_token(
     grant_type: str,
     scope: str,
     id_provider: str,
+    cache: Optional["FileTokenCache"] = None,
 ) -> AccelaAccessToken:
+    if cache is not None:
+        def fetch(cached: Optional[AccelaAccessToken]) -> AccelaAccessToken:
+            if cached is not None:
+                try:
+                    return refresh_access_token(
+                        client_id=client_id, client_secret=client_secret, refresh_token=cached.refresh_token
+                    )
+                except requests.HTTPError:
+                    pass  # The refresh token has expired too; log in again
+            return get_access_token(
+                client_id=client_id,
+                client_secret=client_secret,
+                username=username,
+                password=password,
+                agency_name=agency_name,
+                environment=environment,
+                grant_type=grant_type,
+                scope=scope,
+                id_provider=id_provider,
+            )
+
+        return cache.get_or_fetch(cache.key(client_id, agency_name, environment, scope), fetch)
+
     before_req_time = datetime.now(tz=timezone.utc)
     r = requests.post(
-        "https://apis.accela.com/oauth2/token",
+        TOKEN_URL,
         data={
             "client_id": client_id,
             "client_secret": client_secret,
@@ -40,11 +72,177 @@ def get_access_token(
         },
     )
     r.raise_for_status()
+    return _token_from_response(r.json(), before_req_time)
+
 
+def refresh_access_token(*, client_id: str, client_secret: str, refresh_token: str) -> AccelaAccessToken:
+    """Exchange a refresh token for a new access token.
+
+    Args:
+        client_id: Accela developer app ID
+        client_secret: Accela developer app secret
+        refresh_token: The refresh_token of the token being replaced
+
+    Returns:
+        The new token; it keeps the old refresh token if the response does not include one
+
+    Raises:
+        requests.HTTPError: If the refresh is rejected, e.g. because the refresh token expired
+    """
+    before_req_time = datetime.now(tz=timezone.utc)
+    r = requests.post(
+        TOKEN_URL,
+        data={
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        },
+    )
+    r.raise_for_status()
     data = r.json()
+    data.setdefault("refresh_token", refresh_token)
+    return _token_from_response(data, before_req_time)
+
+
+def _token_from_response(data: Dict[str, Any], before_req_time: datetime) -> AccelaAccessToken:
+    # Count expiry from before the request was sent so clock skew and latency only make the token look older
     return AccelaAccessToken(
         access_token=data["access_token"],
         refresh_token=data["refresh_token"],
-        expires_at=before_req_time + timedelta(seconds=data["expires_in"]),
+        expires_at=before_req_time + timedelta(seconds=int(data["expires_in"])),
         scopes=data["scope"].split(" "),
     )
+
+
+class TokenProvider:
+    """Owns an access token and keeps it valid for one or more clients.
+
+    The token is refreshed `refresh_margin` seconds before it expires, by a background thread and,
+    should that fall behind, by the first request that finds it stale. Refreshes are single-flight:
+    threads and async tasks that need a new token at the same time wait for one refresh. Pass the
+    provider to AccelaClient or AsyncAccelaClient as access_token; a 401 makes the client refresh once
+    and replay the request.
+    """
+
+    def __init__(
+            self,
+            token: AccelaAccessToken,
+            *,
+            client_id: str,
+            client_secret: str,
+            refresh_margin: float = 300.0,
+            background_refresh: bool = True,
+            cache: Optional["FileTokenCache"] = None,
+            cache_key: Optional[str] = None,
+    ):
+        """
+        Args:
+            token: The initial token, e.g. from get_access_token()
+            client_id: Accela developer app ID used to refresh the token
+            client_secret: Accela developer app secret used to refresh the token
+            refresh_margin: Seconds before expires_at at which the token is refreshed, default 300
+            background_refresh: Refresh ahead of expiry on a daemon thread, default True; otherwise the
+                request that finds the token stale refreshes it
+            cache: Optional FileTokenCache through which providers in other processes share refreshed tokens
+            cache_key: Key of the token in the cache, from FileTokenCache.key(); required with a cache
+        """
+        if cache is not None and cache_key is None:
+            raise ValueError("cache_key is required with a cache; see FileTokenCache.key()")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self.cache = cache
+        self.cache_key = cache_key
+        self._token = token
+        # When the current token was issued; unknown for the initial token
+        self._obtained_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background_refresh:
+            self._thread = threading.Thread(target=self._refresh_loop, name="accela-token-refresh", daemon=True)
+            self._thread.start()
+
+    @property
+    def token(self) -> AccelaAccessToken:
+        """The current token, which may be about to expire; use get_token() for one that is valid."""
+        return self._token
+
+    def _margin(self) -> float:
+        if self._obtained_at is None:
+            return self.refresh_margin
+        # Tokens that live shorter than twice the margin are refreshed halfway through instead
+        lifetime = (self._token.expires_at - self._obtained_at).total_seconds()
+        return min(self.refresh_margin, lifetime / 2)
+
+    def _seconds_until_refresh(self) -> float:
+        return (self._token.expires_at - datetime.now(tz=timezone.utc)).total_seconds() - self._margin()
+
+    def _refresh_token(self, cached: Optional[AccelaAccessToken] = None) -> AccelaAccessToken:
+        # A token cached by another process carries the latest refresh token in the chain
+        refresh_token = (cached or self._token).refresh_token
+        return refresh_access_token(
+            client_id=self.client_id, client_secret=self.client_secret, refresh_token=refresh_token
+        )
+
+    def _refresh(self, rejected: Optional[str] = None) -> None:
+        """Replace the token; the caller holds the lock."""
+        obtained_at = datetime.now(tz=timezone.utc)
+        if self.cache is None:
+            self._token = self._refresh_token()
+        else:
+            self._token = self.cache.get_or_fetch(
+                self.cache_key, self._refresh_token, rejected=rejected, min_ttl=self._margin()
+            )
+        self._obtained_at = obtained_at
+
+    def _refresh_if_stale(self, rejected: Optional[str] = None) -> str:
+        with self._lock:
+            # Whoever held the lock before may have refreshed already
+            if self._seconds_until_refresh() <= 0 or self._token.access_token == rejected:
+                self._refresh(rejected)
+            return self._token.access_token
+
+    def get_token(self) -> str:
+        """Return a valid access token, refreshing it first if it is about to expire."""
+        if self._seconds_until_refresh() > 0:
+            return self._token.access_token
+        return self._refresh_if_stale()
+
+    async def aget_token(self) -> str:
+        """Return a valid access token without blocking the event loop on a refresh."""
+        if self._seconds_until_refresh() > 0:
+            return self._token.access_token
+        return await asyncio.to_thread(self._refresh_if_stale)
+
+    def invalidate(self, rejected: str) -> str:
+        """Refresh after the API rejected `rejected`, unless another caller already replaced it.
+
+        Returns:
+            The access token to replay the request with
+        """
+        return self._refresh_if_stale(rejected)
+
+    async def ainvalidate(self, rejected: str) -> str:
+        """Async variant of invalidate()."""
+        return await asyncio.to_thread(self._refresh_if_stale, rejected)
+
+    def _refresh_loop(self) -> None:
+        retry_delay = 5.0
+        while not self._closed.wait(max(self._seconds_until_refresh(), 0.0)):
+            try:
+                self._refresh_if_stale()
+                retry_delay = 5.0
+            except requests.RequestException:
+                # Leave the token to the next request's refresh if the API stays unreachable
+                if self._closed.wait(retry_delay):
+                    return
+                retry_delay = min(retry_delay * 2, 60.0)
+
+    def close(self) -> None:
+        """Stop the background refresh thread."""
+        self._closed.set()
+
+    def __repr__(self) -> str:
+        return f"TokenProvider(expires_at={self._token.expires_at.isoformat()}, scopes={self._token.scopes})"
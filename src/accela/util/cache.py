@@ -0,0 +1,199 @@
+import atexit
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass
+class _CacheEntry:
+    namespace: str
+    expires_at: float
+    value: Any
+
+
+def _flush_at_exit(cache_ref: "weakref.ref[ResponseCache]") -> None:
+    cache = cache_ref()
+    if cache is not None:
+        cache.close()
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of decoded API responses with per-resource TTLs.
+
+    Resources opt in by declaring CACHE_KEY and a default CACHE_TTL (the slow-changing settings endpoints do).
+    Cached values are the decoded JSON bodies, so resources keep returning freshly built models. Values are
+    copied going in and coming out, so changing a returned body or a model's raw_json never changes the cache.
+
+    With a snapshot_path, changes are written to the snapshot in the background at most once every
+    snapshot_interval seconds, and on close() or interpreter exit, rather than on every change.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttls: Optional[Dict[str, float]] = None,
+            snapshot_path: Optional[Union[str, os.PathLike]] = None,
+            snapshot_interval: Optional[float] = 30.0,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of responses kept before the least recently used is evicted, default 1024
+            ttls: Optional per-resource TTLs in seconds overriding the resource defaults, keyed by CACHE_KEY;
+                e.g. {"modules": 3600, "record_types": 600}. A TTL of 0 disables caching for that resource.
+            snapshot_path: Optional JSON file the cache is loaded from on start and persisted to
+            snapshot_interval: Seconds to wait after a change before writing the snapshot, batching the changes
+                made meanwhile, default 30; None writes only on save_snapshot(), flush() and close()
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(ttls or {})
+        self.snapshot_path = os.fspath(snapshot_path) if snapshot_path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.snapshot_interval = snapshot_interval
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+
+        if self.snapshot_path:
+            if os.path.exists(self.snapshot_path):
+                self.load_snapshot()
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, namespace: str, default: Optional[float]) -> Optional[float]:
+        """TTL in seconds for a resource, or None if its responses should not be cached."""
+        ttl = self.ttls.get(namespace, default)
+        return ttl if ttl else None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value for `key`, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, namespace: str, ttl: float) -> None:
+        """Cache a copy of `value` under `key` for `ttl` seconds."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = _CacheEntry(namespace=namespace, expires_at=time.time() + ttl, value=value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._changed()
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached responses for one resource, e.g. "modules", or for every resource when omitted."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for key in [k for k, entry in self._entries.items() if entry.namespace == namespace]:
+                    del self._entries[key]
+            self._changed()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.invalidate()
+
+    def _changed(self) -> None:
+        """Mark the snapshot stale and schedule a write; the caller holds the lock."""
+        if not self.snapshot_path:
+            return
+        self._dirty = True
+        if self.snapshot_interval is not None and self._timer is None:
+            self._timer = threading.Timer(self.snapshot_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write the snapshot now if the cache changed since it was last written."""
+        with self._lock:
+            self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        try:
+            self.save_snapshot()
+        except OSError:
+            with self._lock:
+                self._dirty = True
+            raise
+
+    def close(self) -> None:
+        """Cancel any scheduled write and write pending changes to the snapshot."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if self.snapshot_path:
+            self.flush()
+
+    def save_snapshot(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Write unexpired entries to a JSON file, replacing it atomically.
+
+        Args:
+            path: Destination file; defaults to snapshot_path
+        """
+        path = os.fspath(path) if path is not None else self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path configured")
+
+        now = time.time()
+        with self._lock:
+            data = {
+                key: {"namespace": entry.namespace, "expires_at": entry.expires_at, "value": entry.value}
+                for key, entry in self._entries.items()
+                if entry.expires_at > now
+            }
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".accela-cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load_snapshot(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Load unexpired entries from a JSON snapshot file.
+
+        Args:
+            path: Snapshot file; defaults to snapshot_path
+        """
+        path = os.fspath(path) if path is not None else self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path configured")
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        now = time.time()
+        with self._lock:
+            for key, item in data.items():
+                if item["expires_at"] > now:
+                    self._entries[key] = _CacheEntry(item["namespace"], item["expires_at"], item["value"])
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,275 @@
+import math
+import types
+import typing
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+class Column(ABC):
+    """A single typed column. `data` is a flat array usable through the buffer protocol, e.g. numpy.frombuffer."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @abstractmethod
+    def append(self, value: Any) -> None:
+        """Append one value, or None for a null."""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @abstractmethod
+    def to_list(self) -> List[Any]:
+        """Decode the column back to a list of Python values, with None for nulls."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, length={len(self)})"
+
+
+class FloatColumn(Column):
+    """Float64 column; nulls are stored as NaN."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.data = array("d")
+
+    def append(self, value: Any) -> None:
+        self.data.append(math.nan if value is None else float(value))
+
+    def to_list(self) -> List[Optional[float]]:
+        return [None if math.isnan(value) else value for value in self.data]
+
+
+class IntColumn(Column):
+    """Int64 column with a validity byte per row (1 for a value, 0 for null)."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.data = array("q")
+        self.validity = bytearray()
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.data.append(0)
+            self.validity.append(0)
+        else:
+            self.data.append(int(value))
+            self.validity.append(1)
+
+    def to_list(self) -> List[Optional[int]]:
+        return [value if valid else None for value, valid in zip(self.data, self.validity)]
+
+
+class BoolColumn(IntColumn):
+    """Boolean column stored as 0/1 int8 values with a validity byte per row. Accepts 'Y'/'N' strings."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.data = array("b")
+
+    def append(self, value: Any) -> None:
+        if isinstance(value, str):
+            value = value.upper() == "Y"
+        super().append(value)
+
+    def to_list(self) -> List[Optional[bool]]:
+        return [bool(value) if valid else None for value, valid in zip(self.data, self.validity)]
+
+
+class DatetimeColumn(IntColumn):
+    """Datetime column stored as int64 seconds since the Unix epoch, with a validity byte per row.
+
+    Naive values are interpreted in `timezone`, or as UTC when no timezone is given.
+    """
+
+    def __init__(self, name: str, timezone: Optional[ZoneInfo] = None):
+        super().__init__(name)
+        self.timezone = timezone
+
+    def append(self, value: Any) -> None:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value is not None:
+            if value.tzinfo is None and self.timezone is not None:
+                value = value.replace(tzinfo=self.timezone)
+            if value.tzinfo is None:
+                value = (value - _NAIVE_EPOCH) // _SECOND
+            else:
+                value = (value - _EPOCH) // _SECOND
+        super().append(value)
+
+    def to_list(self) -> List[Optional[datetime]]:
+        tz = self.timezone or dt_timezone.utc
+        return [
+            datetime.fromtimestamp(value, tz) if valid else None
+            for value, valid in zip(self.data, self.validity)
+        ]
+
+
+class DictionaryColumn(Column):
+    """Dictionary-encoded string column: int32 codes into `dictionary`, with -1 for null.
+
+    Accela value objects such as {"value": "Issued", "text": "Issued"} are stored by their value.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.data = array("i")
+        self.dictionary: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def append(self, value: Any) -> None:
+        if isinstance(value, dict):
+            value = value.get("value", value.get("text"))
+        if value is None:
+            self.data.append(-1)
+            return
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.dictionary)
+            self._codes[value] = code
+            self.dictionary.append(value)
+        self.data.append(code)
+
+    def to_list(self) -> List[Optional[str]]:
+        dictionary = self.dictionary
+        return [dictionary[code] if code >= 0 else None for code in self.data]
+
+
+class ObjectColumn(Column):
+    """Fallback column holding arbitrary values, used for lists of nested objects.
+
+    Nested objects are held as the model decodes them, with snake_case keys.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.data: List[Any] = []
+
+    def append(self, value: Any) -> None:
+        self.data.append(value)
+
+    def to_list(self) -> List[Any]:
+        return list(self.data)
+
+
+class ColumnTable(Mapping):
+    """Read-only mapping of field name to Column, with every column the same length."""
+
+    def __init__(self, columns: Dict[str, Column]):
+        self._columns = columns
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def num_rows(self) -> int:
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Decode every column to a list of Python values."""
+        return {name: column.to_list() for name, column in self._columns.items()}
+
+    def __repr__(self) -> str:
+        return f"ColumnTable(columns={list(self._columns)}, num_rows={self.num_rows})"
+
+
+class ColumnBuilder:
+    """Accumulates selected model fields from raw API items into typed columns.
+
+    Column types follow the model's annotations: floats become FloatColumn, ints IntColumn, datetimes
+    DatetimeColumn, booleans BoolColumn, strings and Accela value objects DictionaryColumn, and anything
+    else (lists of nested objects) ObjectColumn. Every column holds the same values whether it is filled
+    from raw API items or from decoded models.
+    """
+
+    def __init__(self, model_class: type, fields: Sequence[str], timezone: Optional[ZoneInfo] = None):
+        """
+        Args:
+            model_class: ResourceModel subclass the items belong to
+            fields: Python field names to collect, e.g. ["balance", "status", "opened_date"]
+            timezone: Optional timezone for naive datetime values; UTC when omitted
+        """
+        if not fields:
+            raise ValueError("At least one field is required")
+
+        api_fields = {python_field: api_field for api_field, python_field in model_class.FIELD_MAPPING.items()}
+        dict_fields = set(model_class.DICT_FIELDS)
+        hints = typing.get_type_hints(model_class)
+        self.model_class = model_class
+        self._columns: Dict[str, Column] = {}
+        self._api_fields: List[tuple] = []
+        for name in fields:
+            if name not in api_fields:
+                raise ValueError(f"{model_class.__name__} has no field {name!r}")
+            column = self._column_for(name, hints.get(name), timezone)
+            self._columns[name] = column
+            append = column.append
+            if isinstance(column, ObjectColumn) and api_fields[name] in dict_fields:
+                # Convert raw camelCase keys as the model's decoder does, so models and raw items agree
+                append = self._converting_append(append, model_class._convert_keys_to_snake_case)
+            self._api_fields.append((api_fields[name], append))
+
+    @staticmethod
+    def _column_for(name: str, hint: Any, timezone: Optional[ZoneInfo]) -> Column:
+        # Unwrap Optional[X]
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if typing.get_origin(hint) in (typing.Union, types.UnionType) and len(args) == 1:
+            hint = args[0]
+        origin = typing.get_origin(hint) or hint
+
+        if origin is bool:
+            return BoolColumn(name)
+        if origin is float:
+            return FloatColumn(name)
+        if origin is int:
+            return IntColumn(name)
+        if origin is datetime:
+            return DatetimeColumn(name, timezone)
+        if origin is str or origin is dict:
+            return DictionaryColumn(name)
+        return ObjectColumn(name)
+
+    @staticmethod
+    def _converting_append(append: Callable[[Any], None], convert: Callable[[Any], Any]) -> Callable[[Any], None]:
+        def append_converted(value: Any) -> None:
+            append(convert(value))
+
+        return append_converted
+
+    def append_raw(self, item: Dict[str, Any]) -> None:
+        """Append one raw API item (camelCase keys, as returned in the response's result array)."""
+        get = item.get
+        for api_field, append in self._api_fields:
+            append(get(api_field))
+
+    def extend_raw(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Append raw API items."""
+        for item in items:
+            self.append_raw(item)
+
+    def append_model(self, model: Any) -> None:
+        """Append an already decoded model, reading its raw_json when it was kept."""
+        if model.raw_json:
+            self.append_raw(model.raw_json)
+            return
+        for name, column in self._columns.items():
+            column.append(getattr(model, name))
+
+    def build(self) -> ColumnTable:
+        """Return the accumulated columns."""
+        return ColumnTable(dict(self._columns))
@@ -0,0 +1,212 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional, Tuple, Union
+
+# Bytes read at a time when hashing and copying blobs
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_atomic(source: str, dest: str) -> None:
+    """Copy a file so that `dest` either keeps its old content or has the complete new content."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest) or ".", prefix=".accela-document-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, open(source, "rb") as src:
+            shutil.copyfileobj(src, f, _COPY_CHUNK_SIZE)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class DocumentStore:
+    """Content-addressed local store of downloaded documents, shared between runs and processes on a host.
+
+    Each distinct content is stored once, under the SHA-256 of its bytes, however many documents carry
+    it. A SQLite index maps document IDs to their blob along with the modified date and size the API
+    reported when they were stored, so a document whose metadata has not changed since is served from
+    disk without downloading it again. When the blobs grow past max_bytes, the least recently used are
+    evicted together with the index entries pointing at them.
+    """
+
+    INDEX_NAME = "index.sqlite3"
+
+    def __init__(self, directory: Union[str, os.PathLike], max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Directory holding the index and the blobs; created if missing
+            max_bytes: Optional maximum total size of stored blobs
+        """
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.join(self.directory, "blobs"), exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(self.directory, self.INDEX_NAME), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS blobs "
+                "(sha256 TEXT PRIMARY KEY, size INTEGER NOT NULL, last_used REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS documents "
+                "(document_id TEXT PRIMARY KEY, modified_date TEXT, size INTEGER, sha256 TEXT NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS documents_sha256 ON documents (sha256);"
+            )
+
+    @staticmethod
+    def _version(document: Any) -> Optional[Tuple[Optional[str], Optional[int]]]:
+        """Modified date and size identifying a document's content, or None if the API reported neither."""
+        modified_date = document.modified_date
+        if isinstance(modified_date, datetime):
+            modified_date = modified_date.isoformat()
+        if modified_date is None and document.size is None:
+            return None
+        return modified_date, document.size
+
+    def _blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, "blobs", sha256[:2], sha256)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def get(self, document: Any) -> Optional[str]:
+        """Return the path of the stored content of `document`, or None if it is missing or has changed.
+
+        The document's modified date and size must match the ones it was stored with. The returned
+        file is shared with every other document with the same content and must not be modified.
+
+        Args:
+            document: A Document, whose ID, modified_date and size are compared with the index
+        """
+        version = self._version(document)
+        with self._lock:
+            row = None
+            if version is not None:
+                row = self._conn.execute(
+                    "SELECT sha256 FROM documents WHERE document_id = ? AND modified_date IS ? AND size IS ?",
+                    (str(document.id), *version),
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            path = self._blob_path(row[0])
+            with self._conn:
+                if not os.path.isfile(path):
+                    # Removed behind the index's back, e.g. by hand or by another process evicting it
+                    self._remove_blob(row[0])
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), row[0]))
+            self.hits += 1
+        return path
+
+    def copy_to(self, document: Any, path: Union[str, os.PathLike]) -> Optional[int]:
+        """Copy the stored content of `document` to `path`, returning its size, or None if it is not stored."""
+        blob = self.get(document)
+        if blob is None:
+            return None
+        try:
+            _copy_atomic(blob, os.fspath(path))
+        except FileNotFoundError:
+            # Evicted by another process between the lookup and the copy
+            return None
+        return os.path.getsize(path)
+
+    def put(self, document: Any, path: Union[str, os.PathLike]) -> str:
+        """Store the content of `path` as the current content of `document`.
+
+        The file is hashed and copied into the store unless a blob with the same content already exists.
+        A blob no document points at any more is removed.
+
+        Args:
+            document: The Document the file was downloaded for
+            path: The downloaded file, which is left in place
+
+        Returns:
+            The path of the stored blob
+        """
+        path = os.fspath(path)
+        sha256 = _sha256_file(path)
+        blob = self._blob_path(sha256)
+        if not os.path.isfile(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            _copy_atomic(path, blob)
+        modified_date, size = self._version(document) or (None, None)
+
+        with self._lock, self._conn:
+            previous = self._conn.execute(
+                "SELECT sha256 FROM documents WHERE document_id = ?", (str(document.id),)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT INTO blobs (sha256, size, last_used) VALUES (?, ?, ?) "
+                "ON CONFLICT(sha256) DO UPDATE SET last_used = excluded.last_used",
+                (sha256, os.path.getsize(blob), time.time()),
+            )
+            self._conn.execute(
+                "INSERT INTO documents (document_id, modified_date, size, sha256) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(document_id) DO UPDATE SET modified_date = excluded.modified_date, "
+                "size = excluded.size, sha256 = excluded.sha256",
+                (str(document.id), modified_date, size, sha256),
+            )
+            if previous is not None and previous[0] != sha256:
+                referenced = self._conn.execute(
+                    "SELECT 1 FROM documents WHERE sha256 = ? LIMIT 1", (previous[0],)
+                ).fetchone()
+                if referenced is None:
+                    self._remove_blob(previous[0])
+            self._evict(keep=sha256)
+        return blob
+
+    def clear(self) -> None:
+        """Remove every stored document and blob."""
+        with self._lock, self._conn:
+            for (sha256,) in self._conn.execute("SELECT sha256 FROM blobs").fetchall():
+                self._remove_blob(sha256)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _remove_blob(self, sha256: str) -> None:
+        """Delete a blob and the index entries pointing at it; the caller holds the lock and a transaction."""
+        self._conn.execute("DELETE FROM documents WHERE sha256 = ?", (sha256,))
+        self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        try:
+            os.unlink(self._blob_path(sha256))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep: str) -> None:
+        if self.max_bytes is None:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Least recently used first; the blob just stored stays even if it alone exceeds max_bytes
+        rows = self._conn.execute(
+            "SELECT sha256, size FROM blobs WHERE sha256 != ? ORDER BY last_used", (keep,)
+        ).fetchall()
+        for sha256, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._remove_blob(sha256)
+            total -= size
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Union
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and the validators needed to revalidate it."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """Bounded on-disk store of response bodies for conditional (ETag / Last-Modified) requests.
+
+    Each entry is one file holding a JSON header line with the validators followed by the raw body.
+    When the store grows past max_bytes or max_entries, the least recently used entries are removed.
+    Entries are keyed by URL, query parameters, agency and environment, not by access token, so a cache
+    directory should not be shared between users with different record visibility.
+    """
+
+    def __init__(
+            self,
+            directory: Union[str, os.PathLike],
+            max_bytes: int = 256 * 1024 * 1024,
+            max_entries: Optional[int] = None,
+    ):
+        """
+        Args:
+            directory: Directory holding cache entries; created if missing
+            max_bytes: Maximum total size of stored entries, default 256 MiB
+            max_entries: Optional maximum number of stored entries
+        """
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".entry"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, name[: -len(".entry")], stat.st_size))
+        # Oldest first, so the OrderedDict is in least recently used order
+        for _, digest, size in sorted(entries):
+            self._sizes[digest] = size
+            self._total_bytes += size
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.entry")
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for `key`, counting a miss if there is none."""
+        digest = self._digest(key)
+        with self._lock:
+            if digest not in self._sizes:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(digest), "rb") as f:
+                    header = json.loads(f.readline())
+                    body = f.read()
+            except (OSError, ValueError):
+                self._remove(digest)
+                self.misses += 1
+                return None
+            self._sizes.move_to_end(digest)
+            os.utime(self._path(digest))
+            self.revalidations += 1
+        return CachedResponse(etag=header.get("etag"), last_modified=header.get("last_modified"), body=body)
+
+    def record_hit(self) -> None:
+        """Count a revalidation that was answered with 304 Not Modified."""
+        with self._lock:
+            self.hits += 1
+
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a response body if the response carries validators and allows storing."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+
+        digest = self._digest(key)
+        header = json.dumps({"etag": etag, "last_modified": last_modified}).encode("utf-8")
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(b"\n")
+                f.write(body)
+            os.replace(tmp_path, self._path(digest))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        size = len(header) + 1 + len(body)
+        with self._lock:
+            self._total_bytes += size - self._sizes.pop(digest, 0)
+            self._sizes[digest] = size
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        with self._lock:
+            for digest in list(self._sizes):
+                self._remove(digest)
+
+    def _remove(self, digest: str) -> None:
+        self._total_bytes -= self._sizes.pop(digest, 0)
+        try:
+            os.unlink(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        while self._sizes and (
+                self._total_bytes > self.max_bytes
+                or (self.max_entries is not None and len(self._sizes) > self.max_entries)
+        ):
+            digest = next(iter(self._sizes))
+            self._remove(digest)
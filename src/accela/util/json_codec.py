@@ -0,0 +1,141 @@
+import codecs
+import json
+from typing import Any, Dict, Optional, Union
+
+
+class JSONCodec:
+    """Parses response bodies and serializes models, using the stdlib json module.
+
+    Subclasses wrap faster third-party libraries. Every codec produces the same values: datetimes and other
+    objects the library cannot serialize natively are written with str(), as json.dumps(default=str) does.
+    Whitespace and escaping of non-ASCII characters may differ between codecs.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        """Serialize an object to a JSON string, indented by two spaces if pretty."""
+        return json.dumps(obj, indent=2 if pretty else None, default=str)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # Pass datetimes to default=str so they serialize like the stdlib codec rather than as ISO 8601
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        options = self._options | self._orjson.OPT_INDENT_2 if pretty else self._options
+        return self._orjson.dumps(obj, default=str, option=options).decode("utf-8")
+
+
+class UjsonCodec(JSONCodec):
+    """Codec backed by ujson."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        return self._ujson.dumps(obj, indent=2 if pretty else 0, default=str)
+
+
+# Preferred order when picking the fastest installed backend
+CODECS: Dict[str, type] = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "json": JSONCodec,
+}
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return a codec by name, or the fastest installed one.
+
+    Args:
+        name: One of "orjson", "ujson" or "json"; "auto" or None picks the first of these that is installed
+
+    Returns:
+        JSONCodec instance
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named backend is not installed
+    """
+    if name is None or name == "auto":
+        for codec_class in CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of {', '.join(CODECS)} or 'auto'")
+    return CODECS[name]()
+
+
+def declared_charset(content_type: Optional[str]) -> Optional[str]:
+    """Python codec name of the charset declared by a Content-Type header, or None for none or an unknown one."""
+    for param in (content_type or "").split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset":
+            try:
+                return codecs.lookup(value.strip().strip("\"'")).name
+            except LookupError:
+                return None
+    return None
+
+
+def utf8_body(content: bytes, content_type: Optional[str]) -> bytes:
+    """A response body in UTF-8, transcoded from the charset its Content-Type declares if that is another one.
+
+    orjson and ujson only read UTF-8, so bodies are transcoded before any codec parses them, as
+    requests' response.json() would decode them with the declared charset.
+    """
+    charset = declared_charset(content_type)
+    if charset is None or charset == "utf-8":
+        return content
+    return content.decode(charset).encode("utf-8")
+
+
+def get_default_codec() -> JSONCodec:
+    """The codec used by clients without a json_codec and by to_json() of models built without a client.
+
+    The fastest installed backend unless set with set_default_codec().
+    """
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = get_codec()
+    return _default_codec
+
+
+def set_default_codec(codec: Union[str, JSONCodec, None]) -> None:
+    """Set the codec used by clients without a json_codec and by to_json() of models built without a client.
+
+    Args:
+        codec: Codec name, JSONCodec instance, or None to go back to picking the fastest installed backend
+    """
+    global _default_codec
+    _default_codec = codec if isinstance(codec, JSONCodec) or codec is None else get_codec(codec)
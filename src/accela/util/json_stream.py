@@ -0,0 +1,152 @@
+import codecs
+import json
+from typing import Any, Dict, List
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+
+# Parser states
+_OBJECT_START = 0
+_KEY = 1
+_COLON = 2
+_VALUE = 3
+_ARRAY = 4
+_DONE = 5
+
+
+class JSONArrayStream:
+    """Incremental parser that pulls the items of one array out of a JSON object as bytes arrive.
+
+    Feed it the response body chunk by chunk; each call returns the items of the `result_key` array that
+    completed in that chunk. Every other top-level member is collected into `meta`, e.g. `total`. Only the
+    unparsed tail of the body is held in memory.
+
+    Items are always decoded with the stdlib json decoder, whatever the client's json_codec: finding where
+    an item ends takes a full scan of it, which raw_decode does in C while decoding. Scanning in Python and
+    then handing the item to orjson was several times slower than raw_decode alone.
+    """
+
+    def __init__(self, result_key: str = "result", encoding: str = "utf-8"):
+        """
+        Args:
+            result_key: Top-level key of the array to stream, default "result"
+            encoding: Charset of the body, default UTF-8
+        """
+        self.result_key = result_key
+        self.meta: Dict[str, Any] = {}
+        # raw_decode forgets its key memo after every call; share keys across items like json.loads does
+        keys: Dict[str, str] = {}
+        self._decoder = json.JSONDecoder(object_pairs_hook=lambda pairs: {keys.setdefault(k, k): v for k, v in pairs})
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._buf = ""
+        self._pos = 0
+        self._chunks: List[str] = []
+        self._chunks_len = 0
+        self._state = _OBJECT_START
+        self._key = None
+        self._need = 0
+        self._eof = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add a chunk of the body and return the array items completed by it."""
+        text = self._text.decode(data)
+        self._chunks.append(text)
+        self._chunks_len += len(text)
+        # After an incomplete value, wait until the pending text has doubled before retrying,
+        # so a large item split across many small chunks is not rescanned for every chunk
+        if len(self._buf) - self._pos + self._chunks_len < self._need:
+            return []
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return any remaining items.
+
+        Raises:
+            ValueError: If the body is not a complete JSON object
+        """
+        self._chunks.append(self._text.decode(b"", final=True))
+        self._eof = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON object in response body")
+        return items
+
+    def _decode(self, pos: int):
+        """Decode the value at pos, returning (value, end), or None if more input is needed."""
+        buf = self._buf
+        try:
+            value, end = self._decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return None
+        # A number cut by the chunk boundary, e.g. "12." of "12.5", decodes early; only accept
+        # numbers and literals once the delimiter that follows them has arrived
+        if not self._eof and not isinstance(value, (dict, list, str)):
+            if end >= len(buf) or buf[end] not in _DELIMITERS:
+                return None
+        return value, end
+
+    def _parse(self) -> List[Any]:
+        # Drop what has been parsed so the buffer only holds the pending tail
+        buf = self._buf = self._buf[self._pos:] + "".join(self._chunks)
+        self._chunks.clear()
+        self._chunks_len = 0
+
+        items = []
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buf) or self._state == _DONE:
+                break
+            char = buf[pos]
+
+            if self._state == _OBJECT_START:
+                if char != "{":
+                    raise ValueError(f"Expected a JSON object, found {char!r}")
+                self._state = _KEY
+                pos += 1
+            elif self._state == _KEY:
+                if char == "}":
+                    self._state = _DONE
+                    pos += 1
+                elif char == ",":
+                    pos += 1
+                else:
+                    decoded = self._decode(pos)
+                    if decoded is None:
+                        break
+                    self._key, pos = decoded
+                    self._state = _COLON
+            elif self._state == _COLON:
+                if char != ":":
+                    raise ValueError(f"Expected ':' after key {self._key!r}, found {char!r}")
+                self._state = _VALUE
+                pos += 1
+            elif self._state == _VALUE:
+                if self._key == self.result_key and char == "[":
+                    self._state = _ARRAY
+                    pos += 1
+                else:
+                    decoded = self._decode(pos)
+                    if decoded is None:
+                        break
+                    self.meta[self._key], pos = decoded
+                    self._state = _KEY
+            elif self._state == _ARRAY:
+                if char == "]":
+                    self._state = _KEY
+                    pos += 1
+                elif char == ",":
+                    pos += 1
+                else:
+                    decoded = self._decode(pos)
+                    if decoded is None:
+                        break
+                    item, pos = decoded
+                    items.append(item)
+
+        self._need = 2 * (len(buf) - pos) if pos < len(buf) and self._state != _DONE else 0
+        self._pos = pos
+        return items
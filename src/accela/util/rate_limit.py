@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Mapping, Optional, Tuple, Union
+
+# Status codes Accela uses to tell a client to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header, given as seconds or an HTTP date, or None if absent."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Token bucket shared by every request a client sends.
+
+    Tokens refill continuously at `rate` per second up to `burst`; each request takes one, waiting for the
+    next token when the bucket is empty. A server's Retry-After is applied with pause(), which holds every
+    request until it expires. Safe to share between threads, and between a sync and an async client.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests sent back to back after an idle period, default max(1, rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            # While paused, refilling starts from the end of the pause
+            self._updated = max(self._updated, self._paused_until)
+            self._tokens = min(self.burst, self._tokens + max(now - self._updated, 0.0) * self.rate)
+            self._updated = max(self._updated, now)
+            self._tokens -= 1
+            # A negative balance is a queue of callers, each waiting for its own token to refill
+            wait_for_token = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return self._updated - now + wait_for_token
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for `seconds`, e.g. for a Retry-After, and drain the bucket's burst."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of requests a client has in flight.
+
+    The limit grows by one for every `limit` requests completed with healthy latency (additive increase),
+    and is multiplied by `decrease` when the server throttles with 429 / 503 (multiplicative decrease).
+    Latency is healthy while it stays within `latency_tolerance` times the fastest response seen. Requests
+    over the limit wait for a slot, so paginators and crawls running many workers settle at the highest
+    parallelism the agency allows.
+
+    Waiting requests are queued in arrival order, and each freed slot, or each slot added by a limit
+    increase, is handed to the oldest one. Threads and coroutines, on any event loop, can share a limiter.
+    """
+
+    def __init__(
+            self,
+            initial: int = 4,
+            minimum: int = 1,
+            maximum: int = 64,
+            decrease: float = 0.5,
+            latency_tolerance: float = 2.0,
+    ):
+        """
+        Args:
+            initial: Starting number of requests in flight, default 4
+            minimum: Lowest limit after backing off, default 1
+            maximum: Highest limit reached by ramping up, default 64
+            decrease: Factor the limit is multiplied by when throttled, default 0.5
+            latency_tolerance: How many times slower than the fastest response seen a response may be
+                and still count towards ramping up, default 2
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.min_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        # Requests waiting for a slot, oldest first: an Event for a thread, or a coroutine's loop and future
+        self._waiters: Deque[Union[threading.Event, Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = deque()
+
+    def _take_free_slot(self) -> bool:
+        """Take a slot if one is free and nobody is queued for it; the caller holds the lock."""
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        return False
+
+    def _hand_out_slots(self) -> None:
+        """Give free slots to the oldest waiters; the caller holds the lock."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            self.in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(_resolve, future)
+
+    def acquire(self) -> None:
+        """Block until fewer requests than the limit are in flight, then take a slot."""
+        with self._lock:
+            if self._take_free_slot():
+                return
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        waiter.wait()
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a slot is free, then take it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._take_free_slot():
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    # The slot was handed over as the wait was cancelled; pass it on
+                    self.in_flight -= 1
+                    self._hand_out_slots()
+            raise
+
+    def release(self, latency: Optional[float], throttled: bool = False) -> None:
+        """Free a slot and adjust the limit from the request's outcome.
+
+        Args:
+            latency: Seconds until the response headers arrived, or None if the request failed without a response
+            throttled: Whether the server answered with 429 or 503
+        """
+        with self._lock:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                # Requests sent before the last cut report the same overload, so back off only once for them
+                started = now - (latency or 0.0)
+                if started > self._last_decrease:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = now
+            elif latency is not None:
+                if self.min_latency is None or latency < self.min_latency:
+                    self.min_latency = latency
+                if latency <= self.min_latency * self.latency_tolerance:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._hand_out_slots()
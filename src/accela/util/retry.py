@@ -0,0 +1,188 @@
+import random
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlparse
+
+# Status codes that usually clear up on their own: server errors and gateways losing the upstream agency
+TRANSIENT_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Methods that are safe to send again after a failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a request that failed with a transient error.
+
+    Delays grow exponentially from `backoff` up to `max_backoff`. With jitter, each delay is drawn
+    uniformly between zero and that bound ("full jitter"), so workers that failed together do not
+    retry together. No retry is scheduled that would end later than `max_elapsed` seconds after the
+    first attempt was sent.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            backoff: float = 0.5,
+            max_backoff: float = 30.0,
+            max_elapsed: Optional[float] = 120.0,
+            jitter: bool = True,
+            status_codes: Iterable[int] = TRANSIENT_STATUS_CODES,
+            methods: Iterable[str] = IDEMPOTENT_METHODS,
+    ):
+        """
+        Args:
+            max_attempts: Attempts per request including the first, default 4
+            backoff: Delay bound before the first retry in seconds, doubled for each further retry, default 0.5
+            max_backoff: Largest delay bound in seconds, default 30
+            max_elapsed: Seconds after the first attempt beyond which no retry is scheduled, default 120;
+                None for no limit
+            jitter: Randomize each delay between zero and its bound, default True
+            status_codes: Response status codes to retry, default 500, 502, 503 and 504
+            methods: HTTP methods to retry, default the idempotent GET, HEAD and OPTIONS
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.status_codes: FrozenSet[int] = frozenset(status_codes)
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before the given retry, counting from 0."""
+        bound = min(self.max_backoff, self.backoff * 2 ** retry)
+        return random.uniform(0, bound) if self.jitter else bound
+
+    def next_delay(self, method: str, retry: int, elapsed: float) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the request should not be retried.
+
+        Args:
+            method: HTTP method of the failed request
+            retry: Number of retries already made for the request
+            elapsed: Seconds since the request's first attempt was sent
+        """
+        if method.upper() not in self.methods or retry + 1 >= self.max_attempts:
+            return None
+        delay = self.delay(retry)
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, "
+            f"max_backoff={self.max_backoff}, max_elapsed={self.max_elapsed}, jitter={self.jitter})"
+        )
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit for its endpoint family is open."""
+
+    def __init__(self, family: str, retry_in: float):
+        super().__init__(f"Circuit for {family!r} endpoints is open after repeated failures; retry in {retry_in:.1f}s")
+        self.family = family
+        self.retry_in = retry_in
+
+
+def endpoint_family(url: str) -> str:
+    """Endpoint family of an API URL, its first path segment after the version: records, documents, settings, ..."""
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    if segments and segments[0].startswith("v") and segments[0][1:].isdigit():
+        segments = segments[1:]
+    return segments[0] if segments else ""
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Fails fast when an endpoint family keeps failing, e.g. while an agency environment is down.
+
+    Each endpoint family (records, documents, settings, ...) has its own circuit. After
+    `failure_threshold` consecutive failed attempts the circuit opens and requests to that family
+    raise CircuitOpenError without being sent. Once `recovery_time` seconds have passed, a single
+    probe request is let through: if it succeeds the circuit closes, otherwise it opens again.
+    Failures are server errors and connection errors; any other response counts as a success.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive failed attempts that open a family's circuit, default 5
+            recovery_time: Seconds an open circuit waits before letting a probe request through, default 30
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+        return circuit
+
+    def state(self, family: str) -> str:
+        """Current state of a family's circuit: "closed", "open" or "half-open"."""
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.opened_at is None:
+                return self.CLOSED
+            if circuit.probing or time.monotonic() - circuit.opened_at >= self.recovery_time:
+                return self.HALF_OPEN
+            return self.OPEN
+
+    def before_request(self, family: str) -> None:
+        """Check that a request to the family may be sent.
+
+        Raises:
+            CircuitOpenError: If the family's circuit is open, or half-open with a probe already in flight
+        """
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.opened_at is None:
+                return
+            retry_in = circuit.opened_at + self.recovery_time - time.monotonic()
+            if retry_in > 0 or circuit.probing:
+                raise CircuitOpenError(family, max(retry_in, 0.0))
+            circuit.probing = True
+
+    def record_success(self, family: str) -> None:
+        """Close the family's circuit after a request that reached a healthy server."""
+        with self._lock:
+            circuit = self._circuit(family)
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.probing = False
+
+    def record_failure(self, family: str) -> None:
+        """Count a failed attempt, opening the family's circuit at the threshold or when a probe fails."""
+        with self._lock:
+            circuit = self._circuit(family)
+            circuit.failures += 1
+            if circuit.probing or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+                circuit.probing = False
+
+    def reset(self, family: Optional[str] = None) -> None:
+        """Close one family's circuit, or every circuit."""
+        with self._lock:
+            if family is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(family, None)
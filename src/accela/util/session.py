@@ -0,0 +1,104 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Type
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass
+class ConnectionStats:
+    """Counters describing the client's traffic and how well its connection pool is being reused."""
+
+    requests: int = 0
+    new_connections: int = 0
+    bytes_received: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def reused_connections(self) -> int:
+        """Number of requests that were sent over an already open connection."""
+        return max(self.requests - self.new_connections, 0)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def record_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes_received += count
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.bytes_received = 0
+
+
+def _counting_pool_class(base: Type[HTTPConnectionPool], stats: ConnectionStats) -> Type[HTTPConnectionPool]:
+    """Build a urllib3 connection pool class whose connections report every socket they open to `stats`."""
+
+    class CountingConnection(base.ConnectionCls):  # type: ignore[name-defined, misc]
+        def connect(self):
+            stats.record_new_connection()
+            return super().connect()
+
+    return type(f"Counting{base.__name__}", (base,), {"ConnectionCls": CountingConnection})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps connection reuse statistics for its pool manager."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # urllib3 shares this mapping between pool managers, so replace it rather than mutating it
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, *args, **kwargs):
+        self.stats.record_request()
+        return super().send(request, *args, **kwargs)
+
+
+def create_session(
+        stats: ConnectionStats,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+) -> requests.Session:
+    """Create a requests Session backed by a counting, pooled HTTP adapter.
+
+    Args:
+        stats: ConnectionStats instance that will receive request and connection counts
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept open per host
+        pool_block: Whether to block when a host's pool is exhausted instead of opening a throwaway connection
+        keep_alive: Whether to keep connections open between requests
+
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        stats,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
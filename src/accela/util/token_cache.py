@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, Optional, Union
+
+from .access_token import AccelaAccessToken
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _default_directory() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "accela", "tokens")
+
+
+class FileTokenCache:
+    """Access tokens shared by the processes on a host through files in a local directory.
+
+    Each token lives in its own file, keyed by client ID, agency, environment and scope, and is
+    replaced atomically so readers never see a partial write. Fetching and refreshing happen
+    under an exclusive file lock, so when a fleet of workers starts at once, one of them
+    authenticates and the rest reuse its token. Files are readable by the current user only.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike, None] = None, min_ttl: float = 300.0):
+        """
+        Args:
+            directory: Directory holding the token files, default $XDG_CACHE_HOME/accela/tokens
+                (~/.cache/accela/tokens)
+            min_ttl: Seconds a cached token must still be valid for to be reused, default 300
+        """
+        self.directory = os.fspath(directory) if directory is not None else _default_directory()
+        self.min_ttl = min_ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(client_id: str, agency: str, environment: str, scope: str) -> str:
+        """Cache key for tokens issued to an app for an agency environment and scope."""
+        scopes = " ".join(sorted(scope.split()))
+        return hashlib.sha256(json.dumps([client_id, agency.upper(), environment.upper(), scopes]).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _usable(self, token: Optional[AccelaAccessToken], rejected: Optional[str], min_ttl: float) -> bool:
+        if token is None or token.access_token == rejected:
+            return False
+        return token.expires_at - datetime.now(tz=timezone.utc) > timedelta(seconds=min_ttl)
+
+    def get(self, key: str) -> Optional[AccelaAccessToken]:
+        """Return the cached token for `key`, even if it has expired, or None if there is none."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return AccelaAccessToken(
+            access_token=data["access_token"],
+            refresh_token=data["refresh_token"],
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+            scopes=data["scopes"],
+        )
+
+    def set(self, key: str, token: AccelaAccessToken) -> None:
+        """Store the token for `key`, replacing any previous one."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        data = {
+            "access_token": token.access_token,
+            "refresh_token": token.refresh_token,
+            "expires_at": token.expires_at.isoformat(),
+            "scopes": token.scopes,
+        }
+        # mkstemp creates the file readable by the current user only
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".accela-token-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Remove the token for `key`, forcing the next process to authenticate."""
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on `key` across threads and processes."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        with self._lock, open(os.path.join(self.directory, f"{key}.lock"), "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def get_or_fetch(
+            self,
+            key: str,
+            fetch: Callable[[Optional[AccelaAccessToken]], AccelaAccessToken],
+            rejected: Optional[str] = None,
+            min_ttl: Optional[float] = None,
+    ) -> AccelaAccessToken:
+        """Return the cached token for `key` if it is still valid, otherwise fetch and store a new one.
+
+        Only one process at a time fetches; the others wait for the lock and then reuse its token.
+
+        Args:
+            key: Cache key from FileTokenCache.key()
+            fetch: Called with the cached token, which may be expired or None, to obtain a new one;
+                e.g. refreshes the cached token or logs in again
+            rejected: An access token the API refused, which is not reused even if it has not expired
+            min_ttl: Seconds the cached token must still be valid for, default the cache's min_ttl
+
+        Returns:
+            A token valid for at least min_ttl seconds, unless fetch returned a shorter-lived one
+        """
+        min_ttl = self.min_ttl if min_ttl is None else min_ttl
+        token = self.get(key)
+        if self._usable(token, rejected, min_ttl):
+            return token
+        with self.lock(key):
+            # Another process may have fetched while this one waited for the lock
+            token = self.get(key)
+            if self._usable(token, rejected, min_ttl):
+                return token
+            token = fetch(token)
+            self.set(key, token)
+            return token
@@ -0,0 +1,111 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+
+class WatermarkStore(ABC):
+    """Persistent mapping of sync keys to the last datetime a sync has seen."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[datetime]:
+        """Return the watermark stored for `key`, or None if there is none."""
+
+    @abstractmethod
+    def set(self, key: str, value: datetime) -> None:
+        """Store the watermark for `key`."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the watermark for `key`, forcing the next sync to start from scratch."""
+
+
+class FileWatermarkStore(WatermarkStore):
+    """Watermark store backed by a JSON file that is replaced atomically on every write."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Args:
+            path: Path of the JSON file; created on first write
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: Dict[str, str]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".watermarks-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[datetime]:
+        with self._lock:
+            value = self._read().get(key)
+        return datetime.fromisoformat(value) if value else None
+
+    def set(self, key: str, value: datetime) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = value.isoformat()
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class SQLiteWatermarkStore(WatermarkStore):
+    """Watermark store backed by a SQLite database."""
+
+    def __init__(self, path: Union[str, os.PathLike], table: str = "accela_watermarks"):
+        """
+        Args:
+            path: Path of the SQLite database file
+            table: Table used to hold watermarks, created if missing
+        """
+        self.path = os.fspath(path)
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.table}" (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+            )
+
+    def get(self, key: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(f'SELECT value FROM "{self.table}" WHERE key = ?', (key,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set(self, key: str, value: datetime) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f'INSERT INTO "{self.table}" (key, value) VALUES (?, ?) '
+                f"ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value.isoformat()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f'DELETE FROM "{self.table}" WHERE key = ?', (key,))
+
+    def close(self) -> None:
+        self._conn.close()